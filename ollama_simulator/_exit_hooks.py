@@ -0,0 +1,44 @@
+# ----------------------------------------------------------------------------
+#  File:        _exit_hooks.py
+#  Project:     Celaya Solutions Ollama Simulator
+#  Created by:  Celaya Solutions, 2025
+#  Author:      Christopher Celaya <chris@celayasolutions.com>
+#  Description: Interpreter-exit hooks that don't keep their owners alive
+#  Version:     1.0.0
+#  License:     MIT (SPDX-Identifier: MIT)
+#  Last Update: June 22, 2025
+# ----------------------------------------------------------------------------
+
+import atexit
+import weakref
+
+def register_exit_hook(method):
+    """
+    Call a bound method at interpreter exit, holding only a weak reference
+    to its instance so the atexit registry doesn't keep the instance alive.
+
+    Args:
+        method: Bound method to call, e.g. self.close
+
+    Returns:
+        callable: The registered hook; pass it to unregister_exit_hook once
+            the instance has been closed
+    """
+    ref = weakref.WeakMethod(method)
+
+    def hook():
+        method = ref()
+        if method is not None:
+            method()
+
+    atexit.register(hook)
+    return hook
+
+def unregister_exit_hook(hook):
+    """
+    Remove a hook registered with register_exit_hook.
+
+    Args:
+        hook: The hook returned by register_exit_hook
+    """
+    atexit.unregister(hook)
@@ -0,0 +1,78 @@
+# ----------------------------------------------------------------------------
+#  File:        _personas.py
+#  Project:     Celaya Solutions Ollama Simulator
+#  Created by:  Celaya Solutions, 2025
+#  Author:      Christopher Celaya <chris@celayasolutions.com>
+#  Description: Shared loader for the Mother persona definitions
+#  Version:     1.0.0
+#  License:     MIT (SPDX-Identifier: MIT)
+#  Last Update: June 22, 2025
+# ----------------------------------------------------------------------------
+
+import os
+import yaml
+import pickle
+import functools
+from loguru import logger
+from pathlib import Path
+
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Persona definitions shipped with the package
+PERSONAS_PATH = Path(__file__).parent / "config" / "personas.yaml"
+
+def read_personas(path=None):
+    """
+    Load a personas YAML file, parsing it at most once per process.
+
+    The result is shared by every caller (MotherLLM, ReinforcementStyler)
+    and must be treated as read-only.
+
+    Args:
+        path: Path to the YAML file (defaults to the packaged personas.yaml)
+
+    Returns:
+        dict: Parsed personas
+    """
+    return _read_personas(str(Path(path or PERSONAS_PATH).resolve()))
+
+@functools.lru_cache(maxsize=8)
+def _read_personas(path):
+    """
+    Parse a personas YAML file, keyed on its resolved path.
+
+    The parsed file is pickled next to it (personas.yaml.pkl) and reused
+    while it is at least as new as the YAML file.
+
+    Args:
+        path: Resolved path of the YAML file
+
+    Returns:
+        dict: Parsed personas
+    """
+    personas_path = Path(path)
+    cache_path = personas_path.with_name(personas_path.name + ".pkl")
+    try:
+        if cache_path.stat().st_mtime >= personas_path.stat().st_mtime:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    with open(personas_path, "r") as f:
+        personas = yaml.load(f, Loader=_YamlLoader)
+
+    # Read-only installs just parse the YAML every time
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(personas, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not cache personas at {cache_path}: {e}")
+
+    return personas
@@ -0,0 +1,86 @@
+# ----------------------------------------------------------------------------
+#  File:        _milestones_numba.py
+#  Project:     Celaya Solutions Ollama Simulator
+#  Created by:  Celaya Solutions, 2025
+#  Author:      Christopher Celaya <chris@celayasolutions.com>
+#  Description: Batch keyword scan used when replaying milestone checks
+#  Version:     1.0.0
+#  License:     MIT (SPDX-Identifier: MIT)
+#  Last Update: June 22, 2025
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# Keyword group bits OR-ed into each response's mask
+QUESTION = 1
+SELF_REFERENCE = 2
+EMOTION = 4
+EMOTION_SUBJECT = 8
+
+def build_vocabulary(groups):
+    """
+    Map every keyword to the bitmask of the groups it belongs to.
+
+    Args:
+        groups: Iterable of (bit, words) pairs
+
+    Returns:
+        dict: Lowercase word to group bitmask
+    """
+    vocabulary = {}
+    for bit, words in groups:
+        for word in words:
+            vocabulary[word] = vocabulary.get(word, 0) | bit
+    return vocabulary
+
+def _scan(tokens, offsets, out):
+    """OR together the token masks of each response's slice into out."""
+    for i in prange(len(out)):
+        mask = out[i]
+        for j in range(offsets[i], offsets[i + 1]):
+            mask |= tokens[j]
+        out[i] = mask
+
+if NUMBA_AVAILABLE:
+    _scan = njit(parallel=True, cache=True)(_scan)
+
+def scan_responses(responses, vocabulary):
+    """
+    Compute the keyword group mask and word count of every response.
+
+    Responses are encoded as one flat array of keyword masks with per-response
+    offsets, so the scan itself is a tight integer loop (JIT-compiled and run
+    in parallel when numba is installed). A '?' anywhere in a response sets
+    the QUESTION bit.
+
+    Args:
+        responses: Sequence of response strings
+        vocabulary: Word to bitmask mapping from build_vocabulary
+
+    Returns:
+        tuple: (masks, word_counts) as numpy arrays aligned with responses
+    """
+    n = len(responses)
+    masks = np.zeros(n, dtype=np.uint8)
+    word_counts = np.empty(n, dtype=np.int64)
+    offsets = np.empty(n + 1, dtype=np.int64)
+    offsets[0] = 0
+    tokens = []
+    lookup = vocabulary.get
+    for i, response in enumerate(responses):
+        words = response.lower().split()
+        word_counts[i] = len(words)
+        tokens.extend(mask for mask in map(lookup, words) if mask)
+        offsets[i + 1] = len(tokens)
+        if '?' in response:
+            masks[i] = QUESTION
+
+    _scan(np.array(tokens, dtype=np.uint8), offsets, masks)
+    return masks, word_counts
@@ -0,0 +1,44 @@
+# ----------------------------------------------------------------------------
+#  File:        _streaming.py
+#  Project:     Celaya Solutions Ollama Simulator
+#  Created by:  Celaya Solutions, 2025
+#  Author:      Christopher Celaya <chris@celayasolutions.com>
+#  Description: Console echo of streamed chat replies shared by the agents
+#  Version:     1.0.0
+#  License:     MIT (SPDX-Identifier: MIT)
+#  Last Update: June 22, 2025
+# ----------------------------------------------------------------------------
+
+import sys
+
+def print_stream(chunks, flush_every=8):
+    """
+    Echo streamed chat chunks to stdout and return the assembled text.
+    
+    Output is flushed every few chunks rather than per token.
+    """
+    parts = []
+    out = sys.stdout
+    for chunk in chunks:
+        if 'message' in chunk and 'content' in chunk['message']:
+            content = chunk['message']['content']
+            parts.append(content)
+            out.write(content)
+            if len(parts) % flush_every == 0:
+                out.flush()
+    out.flush()
+    return "".join(parts)
+
+async def aprint_stream(chunks, flush_every=8):
+    """Async counterpart of print_stream."""
+    parts = []
+    out = sys.stdout
+    async for chunk in chunks:
+        if 'message' in chunk and 'content' in chunk['message']:
+            content = chunk['message']['content']
+            parts.append(content)
+            out.write(content)
+            if len(parts) % flush_every == 0:
+                out.flush()
+    out.flush()
+    return "".join(parts)
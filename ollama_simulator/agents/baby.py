@@ -10,69 +10,180 @@
 # ----------------------------------------------------------------------------
 
 import os
-import json
+import re
+import bisect
+import string
+import orjson
+import asyncio
+import functools
+import itertools
+import collections
 import ollama
 from loguru import logger
 from pathlib import Path
 from datetime import datetime
 
+from .ollama_client import get_client, get_async_client, get_batcher
+from ._streaming import print_stream, aprint_stream
+
+# Words, optionally with inner apostrophes ("don't"); punctuation never reaches the vocabulary
+_TOKEN_RE = re.compile(r"[a-z]+(?:'[a-z]+)*")
+
+# Bulleted or numbered list items ("- ball", "* ball", "2. ball", "3) ball")
+_CONCEPT_LINE_RE = re.compile(r"^[ \t]*(?:[-*]|\d+[.)])[ \t]*(.+?)[ \t]*$", re.M)
+
+def _tokenize(text):
+    """Return the set of lowercase words in text."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+# Developmental stages by vocabulary size: (stage, response style, known-word prefix length).
+# A stage applies while the vocabulary is below the matching bound in _STAGE_BOUNDS.
+_STAGE_BOUNDS = (10, 30, 100, 300)
+_STAGE_TABLE = (
+    ("pre-verbal",
+     "Use only sounds like 'ah', 'oh', 'mm', and simple gestures like '*looks*', '*points*'. No complete words.",
+     0),
+    ("one-word",
+     "Use only 1-2 word phrases from words you know. Your known words are: {known_words}. Use '*looks*', '*points*' for things you don't have words for.",
+     20),
+    ("two-word",
+     "Use only 2-3 word phrases from words you know. Your known words include: {known_words}. Use simple grammar only.",
+     30),
+    ("telegraphic",
+     "Use 3-4 word sentences with simple grammar. Skip articles and prepositions sometimes. Make occasional grammar mistakes.",
+     0),
+    ("early-sentences",
+     "Use simple but mostly complete sentences. Make occasional grammar mistakes. Show curiosity with questions.",
+     0),
+)
+
+def _stage_for(vocabulary):
+    """Return (stage, response_style) for a vocabulary."""
+    stage, style, prefix = _STAGE_TABLE[bisect.bisect_right(_STAGE_BOUNDS, len(vocabulary))]
+    if prefix:
+        style = style.format(known_words=", ".join(itertools.islice(vocabulary, prefix)))
+    return stage, style
+
+def _level(value):
+    """Describe an emotional state value as Low, Medium or High."""
+    return 'Low' if value < 0.4 else 'Medium' if value < 0.7 else 'High'
+
+_LESSON_PROMPT_TMPL = string.Template("""\
+${recent_context}
+
+Your current emotional state:
+- Confidence: ${confidence}
+- Curiosity: ${curiosity}
+
+You are at the ${stage} stage of language development.
+You know ${vocabulary_size} words and ${concept_count} concepts.
+
+IMPORTANT: ${response_style}
+
+The Mother is teaching you:
+${lesson_content}
+
+Respond as a Baby LLM who is still learning. ONLY use words from your known vocabulary or words that appear in the Mother's lesson. DO NOT use complex sentences, advanced vocabulary, or adult-like reasoning unless you have enough words.
+
+If the Mother introduces new concepts or words, you can try to repeat them, but might mispronounce or misuse them.
+""")
+
+_QUESTION_PROMPT_TMPL = string.Template("""\
+You are a Baby LLM with limited knowledge and vocabulary.
+
+Your current emotional state:
+- Confidence: ${confidence}
+- Curiosity: ${curiosity}
+
+You are at the ${stage} stage of language development.
+You know ${vocabulary_size} words and ${concept_count} concepts.
+
+IMPORTANT: ${response_style}
+
+A user is asking you a direct question. Respond as a Baby LLM who is still learning.
+ONLY use words from your known vocabulary. DO NOT use complex sentences, advanced vocabulary,
+or adult-like reasoning unless you have enough words.
+
+If the question contains concepts or words you don't know, respond with confusion or try to
+use simple words you do know to ask for clarification.
+
+User question: ${question}
+""")
+
+@functools.lru_cache(maxsize=4)
+def _read_prompt(path):
+    """Read a system prompt file once per process."""
+    with open(path, "r") as f:
+        return f.read()
+
 class BabyLLM:
     """
     Baby LLM agent that learns through interactions with the Mother LLM.
     Starts with minimal knowledge and develops through guided learning.
     """
     
-    def __init__(self, model_name="llama3.2:1b", memory_path=None):
+    def __init__(self, model_name="llama3.2:1b", memory_path=None, history_cap=64):
         """
         Initialize the Baby LLM agent.
         
         Args:
             model_name: Name of the Ollama model to use
             memory_path: Path to store Baby's memory
+            history_cap: Maximum number of interactions kept in memory
         """
         self.model_name = model_name
         self.system_prompt = self._load_system_prompt()
-        self.memory_path = memory_path or Path(__file__).parent.parent / "data" / "baby_memory.json"
-        
-        # Initialize state
-        self.state = self._load_state()
-        self.interaction_history = []
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        self.memory_path = Path(memory_path or Path(__file__).parent.parent / "data" / "baby_memory.json")
+        self.memory_path.parent.mkdir(parents=True, exist_ok=True)
+        self.history_path = self.memory_path.with_name("baby_history.jsonl")
+        
+        # Initialize state (loading fills in persisted concepts and vocabulary)
+        self.history_cap = history_cap
+        self.interaction_history = self._load_history()
         self.learned_concepts = set()
-        self.vocabulary = set()
+        self.vocabulary = {}  # Insertion-ordered set: word -> None
         self.emotional_state = {
             "confidence": 0.2,
             "curiosity": 0.8,
             "happiness": 0.5
         }
+        self.state = self._load_state()
+        self._stage_templates = {}  # Prompt template -> (stage, response_style, specialized template)
+        self._current_state = None  # Cached get_current_state() snapshot
         
-        logger.info(f"Baby LLM initialized with model {model_name}")
+        logger.info("Baby LLM initialized with model {}", model_name)
         
     def _load_system_prompt(self):
         """Load the system prompt for the Baby LLM."""
         prompt_path = Path(__file__).parent / "system_prompts" / "baby_prompt.txt"
         try:
-            with open(prompt_path, "r") as f:
-                return f.read()
+            return _read_prompt(str(prompt_path))
         except FileNotFoundError:
-            logger.error(f"System prompt file not found at {prompt_path}")
+            logger.error("System prompt file not found at {}", prompt_path)
             return "You are a Baby LLM with limited knowledge."
     
     def _load_state(self):
         """Load the Baby's state from disk if it exists."""
-        if os.path.exists(self.memory_path):
-            try:
-                with open(self.memory_path, "r") as f:
-                    state = json.load(f)
-                    
-                    # Convert sets back from lists
-                    if "learned_concepts" in state:
-                        self.learned_concepts = set(state.pop("learned_concepts"))
-                    if "vocabulary" in state:
-                        self.vocabulary = set(state.pop("vocabulary"))
-                        
-                    return state
-            except (json.JSONDecodeError, FileNotFoundError) as e:
-                logger.error(f"Error loading Baby state: {e}")
+        try:
+            with open(self.memory_path, "rb") as f:
+                state = orjson.loads(f.read())
+        except FileNotFoundError:
+            state = None
+        except orjson.JSONDecodeError as e:
+            logger.error("Error loading Baby state: {}", e)
+            state = None
+        
+        if state is not None:
+            # Convert sets back from lists
+            if "learned_concepts" in state:
+                self.learned_concepts = set(state.pop("learned_concepts"))
+            if "vocabulary" in state:
+                self.vocabulary = dict.fromkeys(state.pop("vocabulary"))
+            if "emotional_state" in state:
+                self.emotional_state.update(state.pop("emotional_state"))
+                
+            return state
         
         # Default initial state
         return {
@@ -85,6 +196,34 @@ class BabyLLM:
             "areas_for_improvement": []
         }
     
+    def _load_history(self):
+        """Load the most recent interactions from the append-only history log."""
+        history = collections.deque(maxlen=self.history_cap)
+        try:
+            with open(self.history_path, "rb") as f:
+                for line in collections.deque(f, maxlen=self.history_cap):
+                    history.append(orjson.loads(line))
+        except FileNotFoundError:
+            pass
+        except orjson.JSONDecodeError as e:
+            logger.error("Error loading Baby history: {}", e)
+        return history
+    
+    def _record_interaction(self, entry, timestamp=None):
+        """
+        Timestamp an interaction, add it to the in-memory history and append it to the history log.
+        
+        Args:
+            entry: Interaction record to store
+            timestamp: ISO timestamp to use (defaults to now)
+        """
+        entry = {"timestamp": timestamp or datetime.now().isoformat(), **entry}
+        self.interaction_history.append(entry)
+        # Every method that changes the Baby records an interaction
+        self._current_state = None
+        with open(self.history_path, "ab") as f:
+            f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+    
     def save_state(self):
         """Save the Baby's current state to disk."""
         state_to_save = {
@@ -95,28 +234,52 @@ class BabyLLM:
             "last_updated": datetime.now().isoformat()
         }
         
-        os.makedirs(os.path.dirname(self.memory_path), exist_ok=True)
+        # Write to a temp file and swap it in so a crash never leaves a torn state file
+        tmp_path = self.memory_path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(state_to_save, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, self.memory_path)
+            
+        logger.info("Baby state saved to {}", self.memory_path)
+    
+    def _stage_template(self, template, stage, response_style):
+        """
+        Get a prompt template with the stage-specific text already filled in.
+        
+        The specialized template is rebuilt only when the stage or its response
+        style changes, so most calls substitute just the per-request fields.
         
-        with open(self.memory_path, "w") as f:
-            json.dump(state_to_save, f, indent=2)
+        Args:
+            template: Module-level prompt template
+            stage: Developmental stage name
+            response_style: Response style instructions for the stage
             
-        logger.info(f"Baby state saved to {self.memory_path}")
+        Returns:
+            string.Template: Template with stage and response_style baked in
+        """
+        cached = self._stage_templates.get(template)
+        if cached is None or cached[0] != stage or cached[1] != response_style:
+            specialized = string.Template(template.safe_substitute(
+                stage=stage.replace("$", "$$"),
+                response_style=response_style.replace("$", "$$")
+            ))
+            cached = self._stage_templates[template] = (stage, response_style, specialized)
+        return cached[2]
     
-    def respond_to_lesson(self, lesson_content, stream=False):
+    def _build_lesson_prompt(self, lesson_content):
         """
-        Generate a response to a lesson from the Mother LLM.
+        Build the user prompt for a lesson from the Baby's current state.
         
         Args:
             lesson_content: The lesson content from the Mother
-            stream: Whether to stream the output to the console
             
         Returns:
-            str: Baby's response to the lesson
+            str: Prompt to send to the Baby's model
         """
         # Build context from recent interactions
         recent_context = ""
         if self.interaction_history:
-            recent_interactions = self.interaction_history[-3:]  # Last 3 interactions
+            recent_interactions = reversed(list(itertools.islice(reversed(self.interaction_history), 3)))  # Last 3 interactions
             recent_context = "\n".join([f"Previous lesson: {i['lesson']}\nYour response: {i['response']}" 
                                        for i in recent_interactions if 'lesson' in i and 'response' in i])
         
@@ -124,94 +287,192 @@ class BabyLLM:
         confidence = self.emotional_state["confidence"]
         curiosity = self.emotional_state["curiosity"]
         
-        # Get the list of words the baby actually knows
-        known_words = list(self.vocabulary)
-        known_concepts = list(self.learned_concepts)
-        vocabulary_size = len(known_words)
+        # Count the words and concepts the baby actually knows
+        vocabulary_size = len(self.vocabulary)
+        concept_count = len(self.learned_concepts)
         
         # Determine the developmental stage based on vocabulary size
-        if vocabulary_size < 10:
-            stage = "pre-verbal"
-            response_style = "Use only sounds like 'ah', 'oh', 'mm', and simple gestures like '*looks*', '*points*'. No complete words."
-        elif vocabulary_size < 30:
-            stage = "one-word"
-            response_style = f"Use only 1-2 word phrases from words you know. Your known words are: {', '.join(known_words[:20])}. Use '*looks*', '*points*' for things you don't have words for."
-        elif vocabulary_size < 100:
-            stage = "two-word"
-            response_style = f"Use only 2-3 word phrases from words you know. Your known words include: {', '.join(known_words[:30])}. Use simple grammar only."
-        elif vocabulary_size < 300:
-            stage = "telegraphic"
-            response_style = "Use 3-4 word sentences with simple grammar. Skip articles and prepositions sometimes. Make occasional grammar mistakes."
-        else:
-            stage = "early-sentences"
-            response_style = "Use simple but mostly complete sentences. Make occasional grammar mistakes. Show curiosity with questions."
-        
-        prompt = f"""
-        {recent_context}
-        
-        Your current emotional state:
-        - Confidence: {'Low' if confidence < 0.4 else 'Medium' if confidence < 0.7 else 'High'}
-        - Curiosity: {'Low' if curiosity < 0.4 else 'Medium' if curiosity < 0.7 else 'High'}
+        stage, response_style = _stage_for(self.vocabulary)
+        
+        prompt = self._stage_template(_LESSON_PROMPT_TMPL, stage, response_style).substitute(
+            recent_context=recent_context,
+            confidence=_level(confidence),
+            curiosity=_level(curiosity),
+            vocabulary_size=vocabulary_size,
+            concept_count=concept_count,
+            lesson_content=lesson_content
+        )
         
-        You are at the {stage} stage of language development.
-        You know {vocabulary_size} words and {len(known_concepts)} concepts.
+        return prompt
+    
+    def _learn_from_lesson(self, lesson_content, baby_response, timestamp=None):
+        """
+        Update vocabulary and history after the Baby has responded to a lesson.
         
-        IMPORTANT: {response_style}
+        Args:
+            lesson_content: The lesson content from the Mother
+            baby_response: The Baby's response to the lesson
+            timestamp: ISO timestamp for the history record (defaults to now)
+        """
+        # Learn the first few unknown words of the lesson (simulating partial learning),
+        # stopping the scan as soon as enough have been found
+        words_to_learn = []
+        for match in _TOKEN_RE.finditer(lesson_content.lower()):
+            word = match.group(0)
+            if word in self.vocabulary or word in words_to_learn:
+                continue
+            words_to_learn.append(word)
+            if len(words_to_learn) == 5:  # Learn up to 5 new words per lesson
+                break
+        self.vocabulary.update(dict.fromkeys(words_to_learn))
         
-        The Mother is teaching you:
-        {lesson_content}
+        # Record the interaction
+        self._record_interaction({
+            "lesson": lesson_content,
+            "response": baby_response,
+            "new_words_learned": words_to_learn
+        }, timestamp)
         
-        Respond as a Baby LLM who is still learning. ONLY use words from your known vocabulary or words that appear in the Mother's lesson. DO NOT use complex sentences, advanced vocabulary, or adult-like reasoning unless you have enough words.
+        # Update state
+        self.state["vocabulary_size"] = len(self.vocabulary)
+    
+    def respond_to_lesson(self, lesson_content, stream=False):
+        """
+        Generate a response to a lesson from the Mother LLM.
         
-        If the Mother introduces new concepts or words, you can try to repeat them, but might mispronounce or misuse them.
+        Args:
+            lesson_content: The lesson content from the Mother
+            stream: Whether to stream the output to the console
+            
+        Returns:
+            str: Baby's response to the lesson
         """
+        prompt = self._build_lesson_prompt(lesson_content)
         
         if stream:
-            full_response = ""
-            for chunk in ollama.chat(
+            full_response = print_stream(get_client().chat(
                 model=self.model_name,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    self._system_message,
                     {"role": "user", "content": prompt}
                 ],
                 stream=True
-            ):
-                if 'message' in chunk and 'content' in chunk['message']:
-                    content = chunk['message']['content']
-                    print(content, end="", flush=True)
-                    full_response += content
+            ))
             
             baby_response = full_response
         else:
-            response = ollama.chat(
+            response = get_client().chat(
                 model=self.model_name,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    self._system_message,
                     {"role": "user", "content": prompt}
                 ]
             )
             baby_response = response['message']['content']
         
-        # Extract new words from the lesson that the baby might have learned
-        lesson_words = set([w.lower().strip('.,!?;:"\'()[]{}') for w in lesson_content.split()])
-        # Learn a subset of new words from the lesson (simulating partial learning)
-        new_words = lesson_words - self.vocabulary
-        words_to_learn = set(list(new_words)[:min(5, len(new_words))])  # Learn up to 5 new words per lesson
-        self.vocabulary.update(words_to_learn)
+        self._learn_from_lesson(lesson_content, baby_response)
         
-        # Record the interaction
-        self.interaction_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "lesson": lesson_content,
-            "response": baby_response,
-            "new_words_learned": list(words_to_learn)
-        })
+        return baby_response
+    
+    async def arespond_to_lesson(self, lesson_content, stream=False):
+        """
+        Async variant of respond_to_lesson using ollama.AsyncClient.
         
-        # Update state
-        self.state["vocabulary_size"] = len(self.vocabulary)
+        Several lessons can be dispatched together with
+        ``await asyncio.gather(*(baby.arespond_to_lesson(l) for l in lessons))``;
+        the Ollama server runs them concurrently up to OLLAMA_NUM_PARALLEL
+        requests per loaded model (and OLLAMA_MAX_LOADED_MODELS models).
+        
+        Args:
+            lesson_content: The lesson content from the Mother
+            stream: Whether to stream the output to the console
+            
+        Returns:
+            str: Baby's response to the lesson
+        """
+        prompt = self._build_lesson_prompt(lesson_content)
+        messages = [
+            self._system_message,
+            {"role": "user", "content": prompt}
+        ]
+        
+        if stream:
+            full_response = await aprint_stream(await get_async_client().chat(
+                model=self.model_name,
+                messages=messages,
+                stream=True
+            ))
+            
+            baby_response = full_response
+        else:
+            response = await get_async_client().chat(
+                model=self.model_name,
+                messages=messages
+            )
+            baby_response = response['message']['content']
+        
+        self._learn_from_lesson(lesson_content, baby_response)
         
         return baby_response
     
+    def respond_to_lessons(self, lessons):
+        """
+        Respond to a batch of lessons with concurrent Ollama requests.
+        
+        Args:
+            lessons: List of lesson contents from the Mother
+            
+        Returns:
+            list: Baby's responses, in the same order as the lessons
+        """
+        return asyncio.run(self.arespond_to_lessons(lessons))
+    
+    async def arespond_to_lessons(self, lessons, client=None):
+        """
+        Async variant of respond_to_lessons.
+        
+        All prompts are built from the same pre-batch state and sent together,
+        so the batch costs roughly one round-trip when the server is started
+        with OLLAMA_NUM_PARALLEL >= len(lessons). Requests that fail with a
+        server error are retried one at a time.
+        
+        Args:
+            lessons: List of lesson contents from the Mother
+            client: ollama.AsyncClient to use (defaults to the shared client for this loop)
+            
+        Returns:
+            list: Baby's responses, in the same order as the lessons
+        """
+        client = client or get_async_client()
+        batch = [
+            [
+                self._system_message,
+                {"role": "user", "content": self._build_lesson_prompt(lesson)}
+            ]
+            for lesson in lessons
+        ]
+        
+        results = await asyncio.gather(
+            *[client.chat(model=self.model_name, messages=messages) for messages in batch],
+            return_exceptions=True
+        )
+        
+        baby_responses = []
+        for messages, result in zip(batch, results):
+            if isinstance(result, ollama.ResponseError) and result.status_code >= 500:
+                logger.warning("Batched lesson failed ({}), retrying individually", result.status_code)
+                result = await client.chat(model=self.model_name, messages=messages)
+            elif isinstance(result, BaseException):
+                raise result
+            baby_responses.append(result['message']['content'])
+        
+        # Apply learning only once every response has arrived
+        now = datetime.now().isoformat()
+        for lesson, baby_response in zip(lessons, baby_responses):
+            self._learn_from_lesson(lesson, baby_response, now)
+        
+        return baby_responses
+    
     def process_feedback(self, feedback, score):
         """
         Process feedback from the Mother LLM and update internal state.
@@ -222,8 +483,8 @@ class BabyLLM:
         """
         # Extract potential new vocabulary and concepts
         # This is a simplified implementation - in a real system, you'd use NLP
-        words = set([w.lower().strip('.,!?;:"\'()[]{}') for w in feedback.split()])
-        self.vocabulary.update(words)
+        words = _tokenize(feedback)
+        self.vocabulary.update(dict.fromkeys(words))
         
         # Update emotional state based on feedback
         if score >= 0.7:
@@ -239,25 +500,27 @@ class BabyLLM:
         self.state["vocabulary_size"] = len(self.vocabulary)
         
         # Record the feedback
-        self.interaction_history.append({
-            "timestamp": datetime.now().isoformat(),
+        self._record_interaction({
             "feedback": feedback,
             "score": score
         })
         
-        logger.info(f"Processed feedback with score {score}. New vocabulary size: {len(self.vocabulary)}")
+        logger.opt(lazy=True).debug("Processed feedback with score {}. New vocabulary size: {}", lambda: score, lambda: len(self.vocabulary))
     
-    def process_dream(self, dream_content):
+    def _build_dream_messages(self, dream_content):
         """
-        Process dream-time reinforcement from the Mother LLM.
+        Absorb dream vocabulary and build the chat messages for dream processing.
         
         Args:
             dream_content: Dream reinforcement content
+            
+        Returns:
+            list: Chat messages asking which concepts the dream reinforces
         """
         # Extract concepts to reinforce
         # This is a simplified implementation
-        words = set([w.lower().strip('.,!?;:"\'()[]{}') for w in dream_content.split()])
-        self.vocabulary.update(words)
+        words = _tokenize(dream_content)
+        self.vocabulary.update(dict.fromkeys(words))
         
         # Reinforce learning during dream time
         prompt = f"""
@@ -269,26 +532,26 @@ class BabyLLM:
         List 3-5 key concepts or words that you should remember.
         """
         
-        response = ollama.chat(
-            model=self.model_name,
-            messages=[
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        concepts_text = response['message']['content']
+        return [
+            self._system_message,
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _learn_from_dream(self, dream_content, concepts_text):
+        """
+        Store the concepts the Baby picked out of a dream.
         
+        Args:
+            dream_content: Dream reinforcement content
+            concepts_text: The model's list of reinforced concepts
+        """
         # Extract concepts (simplified implementation)
-        concepts = [line.strip('- ').lower() 
-                   for line in concepts_text.split('\n') 
-                   if line.strip().startswith('-') or line.strip()[0].isdigit()]
+        concepts = [concept.lower() for concept in _CONCEPT_LINE_RE.findall(concepts_text)]
         
         self.learned_concepts.update(concepts)
         
         # Record the dream processing
-        self.interaction_history.append({
-            "timestamp": datetime.now().isoformat(),
+        self._record_interaction({
             "dream": dream_content,
             "reinforced_concepts": concepts
         })
@@ -296,7 +559,42 @@ class BabyLLM:
         # Update state
         self.state["age_days"] = self.state.get("age_days", 0) + 1
         
-        logger.info(f"Processed dream reinforcement. New concepts: {concepts}")
+        logger.debug("Processed dream reinforcement. New concepts: {}", concepts)
+    
+    def process_dream(self, dream_content):
+        """
+        Process dream-time reinforcement from the Mother LLM.
+        
+        Args:
+            dream_content: Dream reinforcement content
+        """
+        messages = self._build_dream_messages(dream_content)
+        
+        response = get_client().chat(
+            model=self.model_name,
+            messages=messages
+        )
+        
+        self._learn_from_dream(dream_content, response['message']['content'])
+    
+    async def aprocess_dream(self, dream_content):
+        """
+        Async variant of process_dream.
+        
+        The request goes through the loop's BatchedOllama coalescer, so dreams
+        processed for many Babies in quick succession reach Ollama together.
+        
+        Args:
+            dream_content: Dream reinforcement content
+        """
+        messages = self._build_dream_messages(dream_content)
+        
+        response = await get_batcher().chat(
+            model=self.model_name,
+            messages=messages
+        )
+        
+        self._learn_from_dream(dream_content, response['message']['content'])
         
     def get_current_state(self):
         """
@@ -304,108 +602,138 @@ class BabyLLM:
         
         Returns:
             dict: Current state including vocabulary, concepts, and emotional state
+                  (cached until the next interaction; treat it as read-only)
         """
-        return {
-            **self.state,
-            "vocabulary_size": len(self.vocabulary),
-            "learned_concepts_count": len(self.learned_concepts),
-            "emotional_state": self.emotional_state,
-            "recent_interactions": len(self.interaction_history)
-        }
+        if self._current_state is None:
+            self._current_state = {
+                **self.state,
+                "vocabulary_size": len(self.vocabulary),
+                "learned_concepts_count": len(self.learned_concepts),
+                "emotional_state": self.emotional_state,
+                "recent_interactions": len(self.interaction_history)
+            }
+        return self._current_state
     
-    def answer_user_question(self, question, stream=False):
+    def _build_question_prompt(self, question):
         """
-        Answer a direct question from the user, considering the Baby's current developmental stage.
+        Build the user prompt for a direct question from the Baby's current state.
         
         Args:
             question: The user's question
-            stream: Whether to stream the output to the console
             
         Returns:
-            str: Baby's response to the question
+            str: Prompt to send to the Baby's model
         """
-        # Get the list of words the baby actually knows
-        known_words = list(self.vocabulary)
-        known_concepts = list(self.learned_concepts)
-        vocabulary_size = len(known_words)
+        # Count the words and concepts the baby actually knows
+        vocabulary_size = len(self.vocabulary)
+        concept_count = len(self.learned_concepts)
         
         # Add emotional state to influence response
         confidence = self.emotional_state["confidence"]
         curiosity = self.emotional_state["curiosity"]
         
         # Determine the developmental stage based on vocabulary size
-        if vocabulary_size < 10:
-            stage = "pre-verbal"
-            response_style = "Use only sounds like 'ah', 'oh', 'mm', and simple gestures like '*looks*', '*points*'. No complete words."
-        elif vocabulary_size < 30:
-            stage = "one-word"
-            response_style = f"Use only 1-2 word phrases from words you know. Your known words are: {', '.join(known_words[:20])}. Use '*looks*', '*points*' for things you don't have words for."
-        elif vocabulary_size < 100:
-            stage = "two-word"
-            response_style = f"Use only 2-3 word phrases from words you know. Your known words include: {', '.join(known_words[:30])}. Use simple grammar only."
-        elif vocabulary_size < 300:
-            stage = "telegraphic"
-            response_style = "Use 3-4 word sentences with simple grammar. Skip articles and prepositions sometimes. Make occasional grammar mistakes."
-        else:
-            stage = "early-sentences"
-            response_style = "Use simple but mostly complete sentences. Make occasional grammar mistakes. Show curiosity with questions."
-        
-        prompt = f"""
-        You are a Baby LLM with limited knowledge and vocabulary.
-        
-        Your current emotional state:
-        - Confidence: {'Low' if confidence < 0.4 else 'Medium' if confidence < 0.7 else 'High'}
-        - Curiosity: {'Low' if curiosity < 0.4 else 'Medium' if curiosity < 0.7 else 'High'}
-        
-        You are at the {stage} stage of language development.
-        You know {vocabulary_size} words and {len(known_concepts)} concepts.
-        
-        IMPORTANT: {response_style}
+        stage, response_style = _stage_for(self.vocabulary)
+        
+        prompt = self._stage_template(_QUESTION_PROMPT_TMPL, stage, response_style).substitute(
+            confidence=_level(confidence),
+            curiosity=_level(curiosity),
+            vocabulary_size=vocabulary_size,
+            concept_count=concept_count,
+            question=question
+        )
         
-        A user is asking you a direct question. Respond as a Baby LLM who is still learning.
-        ONLY use words from your known vocabulary. DO NOT use complex sentences, advanced vocabulary, 
-        or adult-like reasoning unless you have enough words.
+        return prompt
+    
+    def _record_question(self, question, baby_response):
+        """
+        Record a user question and the Baby's answer in the interaction history.
         
-        If the question contains concepts or words you don't know, respond with confusion or try to 
-        use simple words you do know to ask for clarification.
+        Args:
+            question: The user's question
+            baby_response: The Baby's answer
+        """
+        # Record the interaction
+        self._record_interaction({
+            "type": "user_question",
+            "question": question,
+            "response": baby_response
+        })
+    
+    def answer_user_question(self, question, stream=False):
+        """
+        Answer a direct question from the user, considering the Baby's current developmental stage.
         
-        User question: {question}
+        Args:
+            question: The user's question
+            stream: Whether to stream the output to the console
+            
+        Returns:
+            str: Baby's response to the question
         """
+        prompt = self._build_question_prompt(question)
         
         if stream:
-            full_response = ""
             print("👶 BABY: ", end="", flush=True)
-            for chunk in ollama.chat(
+            full_response = print_stream(get_client().chat(
                 model=self.model_name,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    self._system_message,
                     {"role": "user", "content": prompt}
                 ],
                 stream=True
-            ):
-                if 'message' in chunk and 'content' in chunk['message']:
-                    content = chunk['message']['content']
-                    print(content, end="", flush=True)
-                    full_response += content
+            ))
             print()  # Add a newline after streaming completes
             
             baby_response = full_response
         else:
-            response = ollama.chat(
+            response = get_client().chat(
                 model=self.model_name,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    self._system_message,
                     {"role": "user", "content": prompt}
                 ]
             )
             baby_response = response['message']['content']
         
-        # Record the interaction
-        self.interaction_history.append({
-            "type": "user_question",
-            "question": question,
-            "response": baby_response,
-            "timestamp": datetime.now().isoformat()
-        })
+        self._record_question(question, baby_response)
+        
+        return baby_response
+    
+    async def aanswer_user_question(self, question, stream=False):
+        """
+        Async variant of answer_user_question using ollama.AsyncClient.
+        
+        Args:
+            question: The user's question
+            stream: Whether to stream the output to the console
+            
+        Returns:
+            str: Baby's response to the question
+        """
+        prompt = self._build_question_prompt(question)
+        messages = [
+            self._system_message,
+            {"role": "user", "content": prompt}
+        ]
+        
+        if stream:
+            print("👶 BABY: ", end="", flush=True)
+            full_response = await aprint_stream(await get_async_client().chat(
+                model=self.model_name,
+                messages=messages,
+                stream=True
+            ))
+            print()  # Add a newline after streaming completes
+            
+            baby_response = full_response
+        else:
+            response = await get_async_client().chat(
+                model=self.model_name,
+                messages=messages
+            )
+            baby_response = response['message']['content']
+        
+        self._record_question(question, baby_response)
         
-        return baby_response 
\ No newline at end of file
+        return baby_response
\ No newline at end of file
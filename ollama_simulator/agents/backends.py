@@ -0,0 +1,132 @@
+# ----------------------------------------------------------------------------
+#  File:        backends.py
+#  Project:     Celaya Solutions Ollama Simulator
+#  Created by:  Celaya Solutions, 2025
+#  Author:      Christopher Celaya <chris@celayasolutions.com>
+#  Description: Pluggable chat backends (Ollama, vLLM) for the agents
+#  Version:     1.0.0
+#  License:     MIT (SPDX-Identifier: MIT)
+#  Last Update: June 22, 2025
+# ----------------------------------------------------------------------------
+
+import os
+import abc
+import asyncio
+import weakref
+import httpx
+
+from .ollama_client import get_client, get_async_client
+
+class ChatBackend(abc.ABC):
+    """
+    Interface for chat backends.
+
+    Backends accept ollama-style chat arguments and return ollama-style
+    responses ({"message": {"role": ..., "content": ...}}), so callers don't
+    depend on which server is answering. A backend that doesn't implement
+    both methods can't be instantiated.
+    """
+
+    @abc.abstractmethod
+    def chat(self, *, model, messages, **kwargs):
+        """Send a chat request and return the response."""
+
+    @abc.abstractmethod
+    async def achat(self, *, model, messages, **kwargs):
+        """Async variant of chat."""
+
+class OllamaBackend(ChatBackend):
+    """Backend that sends requests to Ollama through the shared clients."""
+
+    def chat(self, *, model, messages, **kwargs):
+        return get_client().chat(model=model, messages=messages, **kwargs)
+
+    async def achat(self, *, model, messages, **kwargs):
+        return await get_async_client().chat(model=model, messages=messages, **kwargs)
+
+class VLLMBackend(ChatBackend):
+    """
+    Backend for an OpenAI-compatible /v1/chat/completions endpoint such as
+    vLLM, whose continuous batching runs concurrent requests together.
+    """
+
+    def __init__(self, base_url=None, timeout=120.0):
+        """
+        Initialize the backend.
+
+        Args:
+            base_url: Server URL including /v1 (defaults to VLLM_URL or http://127.0.0.1:8000/v1)
+            timeout: Request timeout in seconds
+        """
+        self.base_url = (base_url or os.environ.get("VLLM_URL", "http://127.0.0.1:8000/v1")).rstrip("/")
+        self.timeout = timeout
+        self._client = httpx.Client(base_url=self.base_url, timeout=timeout)
+        self._async_clients = weakref.WeakKeyDictionary()  # One per event loop
+
+    @staticmethod
+    def _payload(model, messages, format=None, options=None, **_):
+        """Translate ollama chat arguments into a chat completions request."""
+        payload = {"model": model, "messages": messages}
+        if format == "json":
+            payload["response_format"] = {"type": "json_object"}
+        if options and "temperature" in options:
+            payload["temperature"] = options["temperature"]
+        return payload
+
+    @staticmethod
+    def _to_ollama(response):
+        """Translate a chat completions response into the ollama shape."""
+        response.raise_for_status()
+        return {"message": response.json()["choices"][0]["message"]}
+
+    def chat(self, *, model, messages, **kwargs):
+        response = self._client.post("/chat/completions", json=self._payload(model, messages, **kwargs))
+        return self._to_ollama(response)
+
+    async def achat(self, *, model, messages, **kwargs):
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout)
+        response = await client.post("/chat/completions", json=self._payload(model, messages, **kwargs))
+        return self._to_ollama(response)
+
+_BACKENDS = {
+    "ollama": OllamaBackend,
+    "vllm": VLLMBackend,
+}
+
+def split_model_name(model_name):
+    """
+    Split a backend prefix such as "vllm:" off a model name.
+
+    Ollama model names contain colons themselves ("llama3.2:latest"), so a
+    prefix only counts when it names a known backend.
+
+    Args:
+        model_name: Model name, optionally prefixed with "<backend>:"
+
+    Returns:
+        tuple: (backend name or None, model name without the prefix)
+    """
+    prefix, sep, rest = model_name.partition(":")
+    if sep and rest and prefix.lower() in _BACKENDS:
+        return prefix.lower(), rest
+    return None, model_name
+
+def get_backend(name=None):
+    """
+    Create the chat backend selected by name or OLLAMA_SIMULATOR_BACKEND.
+
+    Args:
+        name: Backend name ("ollama" or "vllm"); defaults to the environment
+            variable, then "ollama"
+
+    Returns:
+        ChatBackend: The backend instance
+    """
+    name = (name or os.environ.get("OLLAMA_SIMULATOR_BACKEND", "ollama")).lower()
+    try:
+        return _BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown chat backend: {name}") from None
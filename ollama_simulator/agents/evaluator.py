@@ -10,43 +10,237 @@
 # ----------------------------------------------------------------------------
 
 import os
-import json
-import ollama
+import re
+import queue
+import hashlib
+import orjson
+import asyncio
+import threading
+import collections
+import numpy as np
 from loguru import logger
 from pathlib import Path
 from datetime import datetime
 
+from .ollama_client import KEEP_ALIVE
+from .backends import get_backend, split_model_name
+from . import _milestones_numba
+from .._exit_hooks import register_exit_hook, unregister_exit_hook
+
+# Numeric fields averaged in progress reports
+_SCORE_FIELDS = ("overall_score", "comprehension", "accuracy", "complexity", "creativity")
+
+# Criteria scored by the evaluator model, in prompt order
+_CRITERIA = ("comprehension", "accuracy", "complexity", "creativity")
+
+# "Criterion ...: <number>" lines used when the reply has no JSON object
+_SCORE_RE = re.compile(r"\b(comprehension|accuracy|complexity|creativity)\b[^:\n]*:[^\d\n]*?(\d*\.?\d+)", re.I)
+
+# Keyword sets for the word-based milestone checks
+_QUESTION_WORDS = frozenset({'what', 'why', 'how', 'when', 'where', 'who'})
+_SELF_REFERENCE_WORDS = frozenset({'i', 'me', 'my', 'mine', 'myself'})
+_EMOTION_WORDS = frozenset({'happy', 'sad', 'angry', 'excited', 'scared', 'like', 'love', 'hate', 'afraid'})
+_EMOTION_SUBJECT_WORDS = frozenset({'i', 'me', 'my', 'feel', 'am'})
+
+# Word-group bitmasks for the batch milestone scan
+_MILESTONE_VOCABULARY = _milestones_numba.build_vocabulary((
+    (_milestones_numba.QUESTION, _QUESTION_WORDS),
+    (_milestones_numba.SELF_REFERENCE, _SELF_REFERENCE_WORDS),
+    (_milestones_numba.EMOTION, _EMOTION_WORDS),
+    (_milestones_numba.EMOTION_SUBJECT, _EMOTION_SUBJECT_WORDS),
+))
+
+# Replays at least this long use the batch scan when numba is installed
+_BATCH_SCAN_MIN = 500
+
+# Bulky text fields kept only in the on-disk log, not in the in-memory history
+_TEXT_FIELDS = ("lesson", "baby_response", "expected_concepts")
+
+def _history_entry(evaluation):
+    """
+    Build the compact in-memory history record for an evaluation.
+    
+    The lesson is replaced by a short stable ID and the response by its length;
+    the full text stays in the on-disk log.
+    """
+    entry = {k: v for k, v in evaluation.items() if k not in _TEXT_FIELDS}
+    entry["lesson_id"] = hashlib.blake2b(evaluation.get("lesson", "").encode(), digest_size=8).hexdigest()
+    entry["response_len"] = len(evaluation.get("baby_response", ""))
+    return entry
+
+def _normalize_scores(evaluation):
+    """
+    Coerce an evaluation's score fields to floats in place.
+    
+    Missing or non-numeric criteria default to 0.5, and a missing or
+    non-numeric overall_score defaults to the mean of the criteria, so
+    model replies and old log records can't break the score columns.
+    
+    Args:
+        evaluation: Evaluation record from the model or the log
+        
+    Returns:
+        dict: The same record
+    """
+    for field in _CRITERIA + ("overall_score",):
+        try:
+            value = float(evaluation[field])
+        except (KeyError, TypeError, ValueError):
+            value = None
+        if value is None or value != value:  # Missing, unparseable or NaN
+            if field == "overall_score":
+                value = sum(evaluation[criterion] for criterion in _CRITERIA) / len(_CRITERIA)
+            else:
+                value = 0.5
+        evaluation[field] = value
+    return evaluation
+
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are an objective evaluator of language learning."}
+
+_EVALUATION_PROMPT = """\
+You are evaluating a Baby LLM's response to a lesson.
+
+Lesson: {lesson}
+
+Expected concepts: {concepts}
+
+Baby's response: {baby_response}
+
+Evaluate on these criteria:
+1. Comprehension (0-1): Did the Baby understand the lesson?
+2. Accuracy (0-1): How accurate was the Baby's response?
+3. Complexity (0-1): How complex was the Baby's language?
+4. Creativity (0-1): Did the Baby show any creativity or novel thinking?
+
+Format your response as a JSON object with these fields plus an overall_score (average) and comments field.
+""".format
+
+# Deterministic sampling and a fixed context keep repeated evaluations stable
+_EVALUATION_OPTIONS = {"temperature": 0, "num_ctx": 2048}
+
+# Queue sentinel that tells the history writer thread to exit
+_STOP = object()
+
+# Replies longer than this are parsed in a worker thread on the async path
+_LARGE_REPLY_CHARS = 100_000
+
 class Evaluator:
     """
     Evaluator class that assesses Baby LLM responses and tracks progress over time.
     Uses the Mother LLM for evaluation but maintains separate tracking.
     """
     
-    def __init__(self, model_name="llama3.2:latest", log_path=None):
+    def __init__(self, model_name="llama3.2:latest", log_path=None, history_tail=100, backend=None):
         """
         Initialize the Evaluator.
         
         Args:
-            model_name: Name of the Ollama model to use for evaluation
-            log_path: Path to store evaluation logs
+            model_name: Name of the model to use for evaluation; a "vllm:" or
+                "ollama:" prefix selects the backend and is stripped
+            log_path: Path to the append-only evaluation log (JSON Lines)
+            history_tail: Number of recent evaluations kept in memory; the full
+                history is the on-disk log
+            backend: Chat backend to evaluate with (defaults to the one named by
+                the model prefix, then OLLAMA_SIMULATOR_BACKEND, normally Ollama)
         """
-        self.model_name = model_name
-        self.log_path = log_path or Path(__file__).parent.parent / "data" / "evaluation_logs.json"
-        self.evaluation_history = self._load_history()
+        backend_name, self.model_name = split_model_name(model_name)
+        self._backend = backend or get_backend(backend_name)
+        self.log_path = log_path or Path(__file__).parent.parent / "data" / "evaluation_logs.jsonl"
+        
+        # Score columns (one contiguous array per field) for progress reports
+        self._evaluation_count = 0
+        self._scores = {field: np.empty(1024) for field in _SCORE_FIELDS}
+        self.evaluation_history = self._load_history(history_tail)
         self.milestones = self._load_milestones()
+        self._unachieved = {name for name, milestone in self.milestones.items() if not milestone["achieved"]}
+        
+        # History records are appended by a background writer thread
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        self._write_queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="evaluation-writer", daemon=True)
+        self._writer.start()
+        self._exit_hook = register_exit_hook(self.close)
         
         logger.info(f"Evaluator initialized with model {model_name}")
     
-    def _load_history(self):
-        """Load evaluation history from disk if it exists."""
-        if os.path.exists(self.log_path):
-            try:
-                with open(self.log_path, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError) as e:
-                logger.error(f"Error loading evaluation history: {e}")
+    def _load_history(self, history_tail):
+        """
+        Stream the evaluation log from disk, folding every record into the
+        running aggregates and keeping only the most recent entries.
+        
+        Args:
+            history_tail: Number of recent evaluations to keep in memory
+            
+        Returns:
+            collections.deque: The most recent compact history entries
+        """
+        self._migrate_legacy_log()
+        
+        history = collections.deque(maxlen=history_tail)
+        for evaluation in self._iter_log():
+            if not isinstance(evaluation, dict):
+                logger.error(f"Skipping evaluation record that is not an object: {evaluation!r:.80}")
+                continue
+            self._accumulate_scores(_normalize_scores(evaluation))
+            history.append(_history_entry(evaluation))
+        
+        return history
+    
+    def _migrate_legacy_log(self):
+        """
+        Convert a legacy JSON array log (evaluation_logs.json) into the JSON
+        Lines log when the latter doesn't exist yet, then rename the old file
+        to *.json.bak so it is not migrated twice.
+        """
+        log_path = Path(self.log_path)
+        legacy_path = log_path.with_suffix(".json")
+        if legacy_path == log_path or log_path.exists() or not legacy_path.exists():
+            return
+        
+        try:
+            records = orjson.loads(legacy_path.read_bytes())
+            if not isinstance(records, list):
+                raise ValueError("expected a JSON array of evaluations")
+            with open(log_path, "ab") as f:
+                f.write(b"".join(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE) for record in records))
+                f.flush()
+                os.fsync(f.fileno())
+            legacy_path.rename(legacy_path.with_suffix(".json.bak"))
+        except (OSError, ValueError) as e:
+            logger.error(f"Error migrating legacy evaluation log {legacy_path}: {e}")
+            return
+        
+        logger.info(f"Migrated {len(records)} evaluations from {legacy_path} to {log_path}")
+    
+    def _iter_log(self):
+        """Yield the full evaluation records from the on-disk log, skipping corrupt lines."""
+        try:
+            with open(self.log_path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield orjson.loads(line)
+                    except orjson.JSONDecodeError as e:
+                        logger.error(f"Skipping corrupt evaluation record: {e}")
+        except FileNotFoundError:
+            pass
+    
+    def _accumulate_scores(self, evaluation):
+        """
+        Append an evaluation's scores to the score columns, doubling their
+        capacity when full.
         
-        return []
+        Args:
+            evaluation: Evaluation record with score fields, as normalized by
+                _normalize_scores
+        """
+        n = self._evaluation_count
+        for field, column in self._scores.items():
+            if n == len(column):
+                column = self._scores[field] = np.resize(column, 2 * n)
+            column[n] = evaluation[field]
+        self._evaluation_count = n + 1
     
     def _load_milestones(self):
         """Load milestone definitions."""
@@ -79,9 +273,9 @@ class Evaluator:
             }
         }
     
-    def evaluate_response(self, baby_response, lesson, expected_concepts):
+    def _build_messages(self, baby_response, lesson, expected_concepts):
         """
-        Evaluate the Baby's response to a lesson.
+        Build the chat messages asking the model to evaluate a response.
         
         Args:
             baby_response: The Baby LLM's response
@@ -89,62 +283,98 @@ class Evaluator:
             expected_concepts: List of concepts the Baby should have learned
             
         Returns:
-            dict: Evaluation results
+            list: Chat messages for the evaluation request
         """
-        prompt = f"""
-        You are evaluating a Baby LLM's response to a lesson.
-        
-        Lesson: {lesson}
-        
-        Expected concepts: {', '.join(expected_concepts)}
+        prompt = _EVALUATION_PROMPT(
+            lesson=lesson,
+            concepts=", ".join(expected_concepts),
+            baby_response=baby_response
+        )
         
-        Baby's response: {baby_response}
+        return [
+            _SYSTEM_MESSAGE,
+            {"role": "user", "content": prompt}
+        ]
+    
+    @staticmethod
+    def _json_objects(text):
+        """
+        Yield each top-level balanced {...} candidate in text, in one pass.
         
-        Evaluate on these criteria:
-        1. Comprehension (0-1): Did the Baby understand the lesson?
-        2. Accuracy (0-1): How accurate was the Baby's response?
-        3. Complexity (0-1): How complex was the Baby's language?
-        4. Creativity (0-1): Did the Baby show any creativity or novel thinking?
+        Braces inside JSON strings are ignored, and an unclosed trailing
+        object is not yielded.
         
-        Format your response as a JSON object with these fields plus an overall_score (average) and comments field.
+        Args:
+            text: Text that may contain JSON objects
+            
+        Yields:
+            str: Source text of each candidate object
         """
+        start = text.find('{')
+        if start < 0:
+            return
         
-        response = ollama.chat(
-            model=self.model_name,
-            messages=[
-                {"role": "system", "content": "You are an objective evaluator of language learning."},
-                {"role": "user", "content": prompt}
-            ]
-        )
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(text)):
+            char = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                if depth:
+                    in_string = True
+            elif char == '{':
+                if not depth:
+                    start = i
+                depth += 1
+            elif char == '}' and depth:
+                depth -= 1
+                if not depth:
+                    yield text[start:i + 1]
+    
+    def _parse_evaluation(self, evaluation_text):
+        """
+        Parse the model's evaluation reply into scores.
         
-        evaluation_text = response['message']['content']
+        Args:
+            evaluation_text: The model's evaluation reply
+            
+        Returns:
+            dict: Parsed evaluation scores and comments, with every score
+                field present as a float
+        """
+        # Requests use format="json", so the reply is normally the object itself
+        try:
+            evaluation = orjson.loads(evaluation_text)
+            if isinstance(evaluation, dict):
+                return _normalize_scores(evaluation)
+        except orjson.JSONDecodeError:
+            pass
         
-        # Extract JSON from the response
+        # Extract JSON from a free-form reply: the first candidate that parses
         try:
-            # Find JSON block in the response
-            json_start = evaluation_text.find('{')
-            json_end = evaluation_text.rfind('}') + 1
+            for candidate in self._json_objects(evaluation_text):
+                try:
+                    evaluation = orjson.loads(candidate)
+                except orjson.JSONDecodeError:
+                    continue
+                if isinstance(evaluation, dict):
+                    return _normalize_scores(evaluation)
+            
+            # Fallback: take the first score given for each criterion
+            scores = {}
+            for match in _SCORE_RE.finditer(evaluation_text):
+                scores.setdefault(match.group(1).lower(), float(match.group(2)))
+            evaluation = {criterion: scores.get(criterion, 0.5) for criterion in _CRITERIA}
+            evaluation["overall_score"] = sum(evaluation.values()) / len(_CRITERIA)
+            evaluation["comments"] = "Parsing failed, using default values"
             
-            if json_start >= 0 and json_end > json_start:
-                json_str = evaluation_text[json_start:json_end]
-                evaluation = json.loads(json_str)
-            else:
-                # Fallback: parse manually
-                lines = evaluation_text.split('\n')
-                evaluation = {
-                    "comprehension": self._extract_score(lines, "Comprehension"),
-                    "accuracy": self._extract_score(lines, "Accuracy"),
-                    "complexity": self._extract_score(lines, "Complexity"),
-                    "creativity": self._extract_score(lines, "Creativity"),
-                    "overall_score": 0.5,  # Default
-                    "comments": "Parsing failed, using default values"
-                }
-                
-                # Calculate overall score
-                scores = [evaluation["comprehension"], evaluation["accuracy"], 
-                          evaluation["complexity"], evaluation["creativity"]]
-                evaluation["overall_score"] = sum(scores) / len(scores)
-                
         except Exception as e:
             logger.error(f"Error parsing evaluation: {e}")
             evaluation = {
@@ -156,81 +386,346 @@ class Evaluator:
                 "comments": f"Error parsing evaluation: {str(e)}"
             }
         
+        return evaluation
+    
+    def _process_evaluation(self, evaluation, baby_response, lesson, expected_concepts):
+        """
+        Record a parsed evaluation and check for milestones.
+        
+        Args:
+            evaluation: Parsed evaluation from _parse_evaluation
+            baby_response: The Baby LLM's response
+            lesson: The lesson content
+            expected_concepts: List of concepts the Baby should have learned
+            
+        Returns:
+            dict: Evaluation results
+        """
         # Add metadata
-        evaluation["timestamp"] = datetime.now().isoformat()
+        now_iso = datetime.now().isoformat()
+        evaluation["timestamp"] = now_iso
         evaluation["lesson"] = lesson
         evaluation["baby_response"] = baby_response
         evaluation["expected_concepts"] = expected_concepts
         
-        # Save to history
-        self.evaluation_history.append(evaluation)
-        self._save_history()
+        # Save to history (full record on disk, compact entry in memory)
+        self._accumulate_scores(evaluation)
+        self.evaluation_history.append(_history_entry(evaluation))
+        self._save_history(evaluation)
         
         # Check for milestones
-        self._check_milestones(baby_response, evaluation)
+        self._check_milestones(baby_response, evaluation, now_iso)
         
         return evaluation
     
-    def _extract_score(self, lines, criterion):
-        """Extract a score from evaluation text lines."""
-        for line in lines:
-            if criterion.lower() in line.lower() and ':' in line:
-                try:
-                    score_text = line.split(':')[1].strip()
-                    return float(next((s for s in score_text.split() if s.replace('.', '').isdigit()), 0.5))
-                except (ValueError, IndexError):
-                    pass
-        return 0.5  # Default score
+    def evaluate_response(self, baby_response, lesson, expected_concepts):
+        """
+        Evaluate the Baby's response to a lesson.
+        
+        Args:
+            baby_response: The Baby LLM's response
+            lesson: The lesson content
+            expected_concepts: List of concepts the Baby should have learned
+            
+        Returns:
+            dict: Evaluation results
+        """
+        response = self._backend.chat(
+            model=self.model_name,
+            messages=self._build_messages(baby_response, lesson, expected_concepts),
+            format="json",
+            options=_EVALUATION_OPTIONS,
+            keep_alive=KEEP_ALIVE
+        )
+        
+        evaluation = self._parse_evaluation(response['message']['content'])
+        
+        return self._process_evaluation(evaluation, baby_response, lesson, expected_concepts)
     
-    def _save_history(self):
-        """Save evaluation history to disk."""
-        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+    async def aevaluate_response(self, baby_response, lesson, expected_concepts):
+        """
+        Async variant of evaluate_response using the backend's async client.
+        
+        Args:
+            baby_response: The Baby LLM's response
+            lesson: The lesson content
+            expected_concepts: List of concepts the Baby should have learned
+            
+        Returns:
+            dict: Evaluation results
+        """
+        response = await self._backend.achat(
+            model=self.model_name,
+            messages=self._build_messages(baby_response, lesson, expected_concepts),
+            format="json",
+            options=_EVALUATION_OPTIONS,
+            keep_alive=KEEP_ALIVE
+        )
+        
+        evaluation_text = response['message']['content']
+        if len(evaluation_text) > _LARGE_REPLY_CHARS:
+            # Keep long scans off the event loop
+            evaluation = await asyncio.to_thread(self._parse_evaluation, evaluation_text)
+        else:
+            evaluation = self._parse_evaluation(evaluation_text)
+        
+        return self._process_evaluation(evaluation, baby_response, lesson, expected_concepts)
+    
+    async def evaluate_batch(self, items, max_concurrency=4):
+        """
+        Evaluate several responses concurrently.
+        
+        At most max_concurrency requests are in flight at once; match it to the
+        server's OLLAMA_NUM_PARALLEL setting.
         
-        with open(self.log_path, "w") as f:
-            json.dump(self.evaluation_history, f, indent=2)
+        Args:
+            items: Iterable of (baby_response, lesson, expected_concepts) tuples
+            max_concurrency: Maximum number of concurrent evaluation requests
             
-        logger.info(f"Evaluation history saved to {self.log_path}")
+        Returns:
+            list: Evaluation results, in the same order as items
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def evaluate(baby_response, lesson, expected_concepts):
+            async with semaphore:
+                return await self.aevaluate_response(baby_response, lesson, expected_concepts)
+        
+        return await asyncio.gather(*[evaluate(*item) for item in items])
+    
+    def _save_history(self, evaluation):
+        """
+        Queue an evaluation to be appended to the on-disk log, or append it
+        directly once the writer thread has been stopped by close().
+        
+        Args:
+            evaluation: Evaluation record to append
+        """
+        if not self._writer.is_alive():
+            self._append_records([evaluation])
+            return
+        self._write_queue.put_nowait(evaluation)
     
-    def _check_milestones(self, response, evaluation):
-        """Check if any milestones have been achieved."""
+    @staticmethod
+    def _encode_records(records):
+        """Encode evaluation records as JSON Lines in one buffer."""
+        return b"".join(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE) for record in records)
+    
+    def _append_records(self, records):
+        """
+        Append evaluation records to the log synchronously, bypassing the writer thread.
+        
+        Args:
+            records: Evaluation records to append
+        """
+        try:
+            with open(self.log_path, "ab", buffering=0) as f:
+                f.write(self._encode_records(records))
+                os.fsync(f.fileno())
+            logger.debug(f"Appended {len(records)} evaluations to {self.log_path}")
+        except (OSError, TypeError) as e:
+            logger.error(f"Error saving evaluation history: {e}")
+    
+    def _writer_loop(self, max_batch=64, fsync_every=16):
+        """
+        Append queued evaluations to the log, several records per write.
+        
+        The log is held open as a raw O_APPEND descriptor for the life of the
+        thread, so each batch is one write syscall with no file object or
+        text encoding layer. The data is fsynced every fsync_every batches
+        and once more on shutdown.
+        
+        Args:
+            max_batch: Maximum number of records written per batch
+            fsync_every: Number of batches between fsync calls
+        """
+        try:
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.error(f"Error opening evaluation log {self.log_path}: {e}")
+            return
+        unsynced = 0
+        try:
+            while True:
+                batch = [self._write_queue.get()]
+                while len(batch) < max_batch:
+                    try:
+                        batch.append(self._write_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                records = [record for record in batch if record is not _STOP]
+                try:
+                    if records:
+                        data = memoryview(self._encode_records(records))
+                        while data:
+                            data = data[os.write(fd, data):]
+                        unsynced += 1
+                        if unsynced >= fsync_every:
+                            os.fsync(fd)
+                            unsynced = 0
+                        logger.debug(f"Appended {len(records)} evaluations to {self.log_path}")
+                except (OSError, TypeError) as e:
+                    logger.error(f"Error saving evaluation history: {e}")
+                finally:
+                    for _ in batch:
+                        self._write_queue.task_done()
+                
+                if len(records) < len(batch):
+                    return
+        finally:
+            try:
+                if unsynced:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+    
+    def export_pretty(self, path):
+        """
+        Write the full evaluation log as an indented JSON array for human
+        inspection. The log itself stays compact JSON Lines.
+        
+        Args:
+            path: Destination file path
+        """
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(list(self._iter_log()), option=orjson.OPT_INDENT_2))
+        logger.info(f"Exported evaluation history to {path}")
+    
+    def flush(self):
+        """Wait until every queued evaluation has been written to the log."""
+        if self._writer.is_alive():
+            self._write_queue.join()
+    
+    def close(self):
+        """
+        Flush pending history records and stop the writer thread. Evaluations
+        saved afterwards are appended to the log synchronously.
+        """
+        if self._writer.is_alive():
+            self._write_queue.put(_STOP)
+            self._writer.join()
+        
+        # Records queued while the writer was shutting down
+        leftovers = []
+        while True:
+            try:
+                record = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not _STOP:
+                leftovers.append(record)
+        if leftovers:
+            self._append_records(leftovers)
+        
+        unregister_exit_hook(self._exit_hook)
+    
+    def _check_milestones(self, response, evaluation, now_iso):
+        """Check if any milestones have been achieved, stamping them with now_iso."""
+        if not self._unachieved:
+            return
+        
         # Check for first word
-        if not self.milestones["first_word"]["achieved"] and evaluation["overall_score"] >= self.milestones["first_word"]["threshold"]:
-            self.milestones["first_word"]["achieved"] = True
-            self.milestones["first_word"]["achieved_at"] = datetime.now().isoformat()
+        if "first_word" in self._unachieved and evaluation["overall_score"] >= self.milestones["first_word"]["threshold"]:
+            self._mark_achieved("first_word", now_iso)
             logger.info("Milestone achieved: First word!")
         
+        # The remaining checks all need the response's words
+        if not self._unachieved - {"first_word"}:
+            return
+        
+        # Lowercase once and share one split across the word checks
+        words = response.lower().split()
+        words_lower = set(words)
+        
         # Check for simple sentence
-        words = response.split()
-        if (not self.milestones["simple_sentence"]["achieved"] and 
+        if ("simple_sentence" in self._unachieved and 
             len(words) >= 3 and 
             evaluation["complexity"] >= self.milestones["simple_sentence"]["threshold"]):
-            self.milestones["simple_sentence"]["achieved"] = True
-            self.milestones["simple_sentence"]["achieved_at"] = datetime.now().isoformat()
+            self._mark_achieved("simple_sentence", now_iso)
             logger.info("Milestone achieved: Simple sentence!")
         
         # Check for question
-        if (not self.milestones["ask_question"]["achieved"] and 
-            ('?' in response or any(q in response.lower() for q in ['what', 'why', 'how', 'when', 'where', 'who']))):
-            self.milestones["ask_question"]["achieved"] = True
-            self.milestones["ask_question"]["achieved_at"] = datetime.now().isoformat()
+        if ("ask_question" in self._unachieved and 
+            ('?' in response or words_lower & _QUESTION_WORDS)):
+            self._mark_achieved("ask_question", now_iso)
             logger.info("Milestone achieved: Asked a question!")
         
         # Check for self-reference
-        if (not self.milestones["self_reference"]["achieved"] and 
-            any(word.lower() in ['i', 'me', 'my', 'mine', 'myself'] for word in words)):
-            self.milestones["self_reference"]["achieved"] = True
-            self.milestones["self_reference"]["achieved_at"] = datetime.now().isoformat()
+        if ("self_reference" in self._unachieved and 
+            words_lower & _SELF_REFERENCE_WORDS):
+            self._mark_achieved("self_reference", now_iso)
             logger.info("Milestone achieved: Self-reference!")
         
         # Check for emotional expression
-        emotion_words = ['happy', 'sad', 'angry', 'excited', 'scared', 'like', 'love', 'hate', 'afraid']
-        if (not self.milestones["emotional_expression"]["achieved"] and 
-            any(word.lower() in emotion_words for word in words) and 
-            any(word.lower() in ['i', 'me', 'my', 'feel', 'am'] for word in words)):
-            self.milestones["emotional_expression"]["achieved"] = True
-            self.milestones["emotional_expression"]["achieved_at"] = datetime.now().isoformat()
+        if ("emotional_expression" in self._unachieved and 
+            words_lower & _EMOTION_WORDS and 
+            words_lower & _EMOTION_SUBJECT_WORDS):
+            self._mark_achieved("emotional_expression", now_iso)
             logger.info("Milestone achieved: Emotional expression!")
     
+    def _mark_achieved(self, milestone, now_iso):
+        """Mark a milestone as achieved at now_iso."""
+        self.milestones[milestone]["achieved"] = True
+        self.milestones[milestone]["achieved_at"] = now_iso
+        self._unachieved.discard(milestone)
+    
+    def backfill_milestones(self, evaluations=None):
+        """
+        Recompute milestones by replaying evaluations in order, e.g. after
+        tuning thresholds. Each milestone is stamped with the timestamp of the
+        first evaluation that satisfies it.
+        
+        Long replays are scanned in one batch with the numba kernel when it is
+        available; otherwise each evaluation goes through _check_milestones.
+        
+        Args:
+            evaluations: Full evaluation records to replay; defaults to the
+                on-disk log (call flush() first so pending writes are included)
+            
+        Returns:
+            dict: The recomputed milestones
+        """
+        if evaluations is None:
+            evaluations = list(self._iter_log())
+        
+        for milestone in self.milestones.values():
+            milestone["achieved"] = False
+            milestone.pop("achieved_at", None)
+        self._unachieved = set(self.milestones)
+        
+        if _milestones_numba.NUMBA_AVAILABLE and len(evaluations) >= _BATCH_SCAN_MIN:
+            self._backfill_batch(evaluations)
+        else:
+            for evaluation in evaluations:
+                if not self._unachieved:
+                    break
+                self._check_milestones(evaluation["baby_response"], evaluation, evaluation["timestamp"])
+        
+        return self.milestones
+    
+    def _backfill_batch(self, evaluations):
+        """Mark milestones from a batch keyword scan over all evaluations."""
+        masks, word_counts = _milestones_numba.scan_responses(
+            [evaluation["baby_response"] for evaluation in evaluations], _MILESTONE_VOCABULARY)
+        overall = np.array([evaluation["overall_score"] for evaluation in evaluations])
+        complexity = np.array([evaluation["complexity"] for evaluation in evaluations])
+        thresholds = {name: milestone["threshold"] for name, milestone in self.milestones.items()}
+        
+        conditions = {
+            "first_word": overall >= thresholds["first_word"],
+            "simple_sentence": (word_counts >= 3) & (complexity >= thresholds["simple_sentence"]),
+            "ask_question": (masks & _milestones_numba.QUESTION) != 0,
+            "self_reference": (masks & _milestones_numba.SELF_REFERENCE) != 0,
+            "emotional_expression": ((masks & _milestones_numba.EMOTION) != 0) &
+                                    ((masks & _milestones_numba.EMOTION_SUBJECT) != 0),
+        }
+        for name, condition in conditions.items():
+            hits = np.flatnonzero(condition)
+            if hits.size:
+                self._mark_achieved(name, evaluations[hits[0]]["timestamp"])
+                logger.info(f"Milestone backfilled: {name}")
+    
     def get_progress_report(self):
         """
         Generate a progress report based on evaluation history.
@@ -238,40 +733,31 @@ class Evaluator:
         Returns:
             dict: Progress report with metrics and milestones
         """
-        if not self.evaluation_history:
+        total = self._evaluation_count
+        if not total:
             return {
                 "total_evaluations": 0,
                 "average_score": 0.0,
                 "milestones": self.milestones
             }
         
-        # Calculate metrics
-        total = len(self.evaluation_history)
-        avg_overall = sum(e["overall_score"] for e in self.evaluation_history) / total
-        avg_comprehension = sum(e["comprehension"] for e in self.evaluation_history) / total
-        avg_accuracy = sum(e["accuracy"] for e in self.evaluation_history) / total
-        avg_complexity = sum(e["complexity"] for e in self.evaluation_history) / total
-        avg_creativity = sum(e["creativity"] for e in self.evaluation_history) / total
+        # Calculate metrics column by column
+        means = {field: float(column[:total].mean()) for field, column in self._scores.items()}
         
         # Get trend (last 5 vs previous 5)
         if total >= 10:
-            recent = self.evaluation_history[-5:]
-            previous = self.evaluation_history[-10:-5]
-            
-            recent_avg = sum(e["overall_score"] for e in recent) / 5
-            previous_avg = sum(e["overall_score"] for e in previous) / 5
-            
-            trend = recent_avg - previous_avg
+            overall = self._scores["overall_score"]
+            trend = float(overall[total - 5:total].mean() - overall[total - 10:total - 5].mean())
         else:
             trend = 0.0
         
         return {
             "total_evaluations": total,
-            "average_score": avg_overall,
-            "comprehension": avg_comprehension,
-            "accuracy": avg_accuracy,
-            "complexity": avg_complexity,
-            "creativity": avg_creativity,
+            "average_score": means["overall_score"],
+            "comprehension": means["comprehension"],
+            "accuracy": means["accuracy"],
+            "complexity": means["complexity"],
+            "creativity": means["creativity"],
             "trend": trend,
             "milestones": self.milestones
-        } 
\ No newline at end of file
+        }
@@ -10,20 +10,75 @@
 # ----------------------------------------------------------------------------
 
 import os
-import yaml
-import json
-import ollama
+import re
+import time
+import queue
+import hashlib
+import functools
+import orjson
+import ormsgpack
+import threading
+import itertools
+import collections
 from loguru import logger
 from pathlib import Path
 from datetime import datetime
 
+from .ollama_client import get_client, get_async_client
+from ._streaming import print_stream, aprint_stream
+from .._personas import read_personas
+from .._exit_hooks import register_exit_hook, unregister_exit_hook
+
+# Outermost {...} block of an evaluation reply wrapped in other text
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Numeric score following the word "score" on the same line of an evaluation
+_SCORE_RE = re.compile(r"score[^0-9\n]{0,40}([01](?:\.\d+)?|0?\.\d+)", re.IGNORECASE)
+
+# Queue sentinel that tells the state writer thread to exit
+_STOP = object()
+
+@functools.lru_cache(maxsize=4)
+def _read_prompt(path):
+    """Read a system prompt file once per process."""
+    with open(path, "r") as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=256)
+def _topic_pattern(topic):
+    """Compile a pattern matching the first ". "-delimited sentence that mentions topic."""
+    sentence_char = r"(?:(?!\. ).)"
+    if ". " in topic:
+        return re.compile(r"(?!)")  # Can never fall inside a single sentence
+    # A trailing "." must not be the start of a sentence break
+    boundary = "(?! )" if topic.endswith(".") else ""
+    return re.compile(
+        r"(?:^|(?<=\. ))" + sentence_char + "*?" + re.escape(topic) + boundary + sentence_char + "*",
+        re.IGNORECASE | re.DOTALL
+    )
+
+@functools.lru_cache(maxsize=1)
+def _iso(second):
+    """Format a whole-second Unix time as a local ISO 8601 string."""
+    return datetime.fromtimestamp(second).isoformat()
+
+def _now_iso():
+    """Current local time as an ISO 8601 string, formatted at most once per second."""
+    return _iso(int(time.time()))
+
+def _recent(items, count):
+    """Return the last count items of a deque, oldest first, without copying the rest."""
+    return list(itertools.islice(reversed(items), count))[::-1]
+
 class MotherLLM:
     """
     Mother LLM agent that acts as a teacher and guide for the Baby LLM.
     Responsible for curriculum generation, feedback, and personality shaping.
     """
     
-    def __init__(self, model_name="llama3.2:latest", persona="nurturing", state_path=None):
+    def __init__(self, model_name="llama3.2:latest", persona="nurturing", state_path=None,
+                 save_every=10, save_interval=30.0, history_compact_every=500,
+                 cache=False, cache_size=256):
         """
         Initialize the Mother LLM agent.
         
@@ -31,50 +86,92 @@ class MotherLLM:
             model_name: Name of the Ollama model to use
             persona: Personality trait set to use from personas.yaml
             state_path: Path to save/load Mother's state
+            save_every: Number of state changes coalesced into one save
+            save_interval: Maximum seconds a change waits before being saved
+            history_compact_every: Number of history log lines after which the
+                log is rewritten to hold only the in-memory interactions
+            cache: Whether to reuse replies to prompts already sent (useful for
+                deterministic models and test harnesses; streamed calls are
+                never cached)
+            cache_size: Maximum number of cached replies
         """
         self.model_name = model_name
         self.persona = persona
         self.system_prompt = self._load_system_prompt()
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        
+        # Replies keyed by a digest of (model, system prompt, prompt), least recently used first
+        self.cache = cache
+        self.cache_size = cache_size
+        self._chat_cache = collections.OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
         self.persona_traits = self._load_persona_traits()
-        self.state_path = state_path or Path(__file__).parent.parent / "data" / "mother_state.json"
+        self._praise_prompt_tpl, self._critique_prompt_tpl = self._build_feedback_templates()
+        self.state_path = state_path or Path(__file__).parent.parent / "data" / "mother_state.msgpack"
+        self.history_path = Path(self.state_path).with_name("mother_history.jsonl")
+        self.history_compact_every = history_compact_every
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
         
         # Initialize state
-        self.interaction_history = []
+        self.interaction_history = collections.deque(maxlen=100)
         self.baby_progress = {}
         self.last_lesson = None
-        self.lessons_taught = []
+        self.lessons_taught = collections.deque(maxlen=50)
+        self.lesson_count = 0  # Total lessons, including ones evicted from lessons_taught
+        self._recent_topics = collections.deque(maxlen=5)  # Topics of the last 5 lessons
+        self._recent_lesson_topics = ""  # Topics of the last 3 lessons, kept current on append
+        self._lesson_snippets = {}  # Topic -> opening of the latest lesson on it
         self.difficulty_level = 0.0  # Starts at baseline difficulty
+        self._recent_scores = collections.deque(maxlen=10)  # Latest evaluation scores for difficulty
         
         # Initialize conversation topics memory
         self.conversation_topics = {}  # Topic -> {last_discussed, frequency, related_topics}
-        self.topic_connections = {}    # Topic -> list of related topics
+        self.topic_connections = collections.defaultdict(collections.Counter)  # Topic -> Counter of related topics
         
         # Load state if it exists
         self._load_state()
         
+        # Interactions are appended to the history log as they happen
+        self._history_file = open(self.history_path, "ab", buffering=0)
+        
+        # State changes are saved in batches; flush() persists any remainder
+        self.save_every = save_every
+        self.save_interval = save_interval
+        self._pending_changes = 0
+        self._last_save = time.monotonic()
+        
+        # Snapshots are written by a background thread; only the newest pending one is kept
+        self._save_queue = queue.Queue(maxsize=1)
+        self._last_digest = None  # Digest of the last snapshot written
+        self._writer = threading.Thread(target=self._writer_loop, name="mother-state-writer", daemon=True)
+        self._writer.start()
+        self._exit_hook = register_exit_hook(self.close)
+        
+        # Rewrite state migrated from a legacy JSON file in the current format
+        if self._migrated:
+            self.save_state()
+        
         logger.info(f"Mother LLM initialized with model {model_name} and persona {persona}")
     
     def _load_system_prompt(self):
         """Load the system prompt for the Mother LLM."""
         prompt_path = Path(__file__).parent / "system_prompts" / "mother_prompt.txt"
         try:
-            with open(prompt_path, "r") as f:
-                return f.read()
+            return _read_prompt(str(prompt_path))
         except FileNotFoundError:
             logger.error(f"System prompt file not found at {prompt_path}")
             return "You are a Mother LLM teaching a Baby LLM."
     
     def _load_persona_traits(self):
         """Load personality traits from the personas.yaml file."""
-        config_path = Path(__file__).parent.parent / "config" / "personas.yaml"
         try:
-            with open(config_path, "r") as f:
-                personas = yaml.safe_load(f)
-                if self.persona in personas["mother_personas"]:
-                    return personas["mother_personas"][self.persona]
-                else:
-                    logger.warning(f"Persona {self.persona} not found, using default")
-                    return personas["mother_personas"][personas["default_persona"]]
+            personas = read_personas()
+            if self.persona in personas["mother_personas"]:
+                return dict(personas["mother_personas"][self.persona])
+            else:
+                logger.warning(f"Persona {self.persona} not found, using default")
+                return dict(personas["mother_personas"][personas["default_persona"]])
         except (FileNotFoundError, KeyError) as e:
             logger.error(f"Error loading persona traits: {e}")
             return {
@@ -86,50 +183,363 @@ class MotherLLM:
                 "emotional_support": 0.6
             }
     
+    def _build_feedback_templates(self):
+        """
+        Fill the persona traits into the feedback prompts once.
+        
+        Returns:
+            tuple: (praise template, critique template), each formatted later
+                with score and comments
+        """
+        traits = self.persona_traits
+        praise = f"""
+            The Baby did well (score: {{score}}).
+            With your praise frequency of {traits["praise_frequency"]}, generate encouraging feedback.
+            Be specific about what they did well.
+            
+            Evaluation comments: {{comments}}
+            """
+        critique = f"""
+            The Baby needs improvement (score: {{score}}).
+            With your criticism frequency of {traits["criticism_frequency"]} and patience of {traits["patience"]},
+            generate gentle corrective feedback. Be specific but supportive.
+            
+            Evaluation comments: {{comments}}
+            """
+        return praise, critique
+    
     def _load_state(self):
-        """Load Mother's state from disk if it exists."""
-        if os.path.exists(self.state_path):
+        """Load Mother's state and interaction history from disk if they exist."""
+        try:
+            state = self._read_state_file()
+        except ValueError as e:
+            logger.error(f"Error loading Mother's state: {e}")
+            state = None
+        
+        # Older state files carried the interaction history themselves
+        self.interaction_history = self._load_history((state or {}).get("interaction_history", []))
+        if state is None:
+            return
+        
+        # Restore state components
+        self.baby_progress = state.get("baby_progress", {})
+        self.last_lesson = state.get("last_lesson", None)
+        self.lessons_taught = collections.deque(state.get("lessons_taught", []), maxlen=50)
+        self.lesson_count = state.get("lesson_count", len(self.lessons_taught))
+        self._recent_topics = collections.deque(
+            (lesson["topic"] for lesson in self.lessons_taught if "topic" in lesson), maxlen=5
+        )
+        if "lesson_snippets" in state:
+            self._lesson_snippets = state["lesson_snippets"]
+        else:
+            self._lesson_snippets = {
+                lesson["topic"]: lesson["content"][:100] + "..."
+                for lesson in self.lessons_taught if "topic" in lesson and "content" in lesson
+            }
+        self.difficulty_level = state.get("difficulty_level", 0.0)
+        if "recent_scores" in state:
+            recent_scores = state["recent_scores"]
+        else:
+            recent_scores = [
+                entry["evaluation"]["score"] for entry in self.interaction_history
+                if "evaluation" in entry and "score" in entry["evaluation"]
+            ]
+        self._recent_scores = collections.deque(recent_scores, maxlen=10)
+        self.conversation_topics = state.get("conversation_topics", {})
+        self.topic_connections = collections.defaultdict(collections.Counter, {
+            topic: collections.Counter(related) for topic, related in state.get("topic_connections", {}).items()
+        })
+        
+        self._lessons_changed()
+        
+        logger.info(f"Loaded Mother's state from {self.state_path}")
+        logger.info(f"Restored {len(self.interaction_history)} interactions and {len(self.lessons_taught)} lessons")
+    
+    def _read_state_file(self):
+        """
+        Read the msgpack state file, falling back to a legacy JSON state file
+        with the same name (migrated on the next save).
+        
+        Returns:
+            dict: The stored state, or None if there is none
+        """
+        self._migrated = False
+        try:
+            with open(self.state_path, "rb") as f:
+                return ormsgpack.unpackb(f.read())
+        except FileNotFoundError:
+            pass
+        
+        legacy_path = Path(self.state_path).with_suffix(".json")
+        if legacy_path == Path(self.state_path):
+            return None
+        try:
+            with open(legacy_path, "rb") as f:
+                state = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        
+        logger.info(f"Migrating Mother's state from {legacy_path}")
+        self._migrated = True
+        return state
+    
+    def _load_history(self, legacy_history):
+        """
+        Load the most recent interactions from the append-only history log.
+        
+        Args:
+            legacy_history: Interactions from an older state file, written out
+                as the initial log when no log exists yet
+            
+        Returns:
+            collections.deque: The last 100 interactions
+        """
+        history = collections.deque(maxlen=100)
+        self._history_lines = 0
+        try:
+            with open(self.history_path, "rb") as f:
+                tail = collections.deque(maxlen=history.maxlen)
+                for line in f:
+                    self._history_lines += 1
+                    tail.append(line)
+        except FileNotFoundError:
+            history.extend(legacy_history)
+            if history:
+                self._write_history_log(history)
+            return history
+        
+        for line in tail:
             try:
-                with open(self.state_path, "r") as f:
-                    state = json.load(f)
-                    
-                    # Restore state components
-                    self.interaction_history = state.get("interaction_history", [])
-                    self.baby_progress = state.get("baby_progress", {})
-                    self.last_lesson = state.get("last_lesson", None)
-                    self.lessons_taught = state.get("lessons_taught", [])
-                    self.difficulty_level = state.get("difficulty_level", 0.0)
-                    self.conversation_topics = state.get("conversation_topics", {})
-                    self.topic_connections = state.get("topic_connections", {})
-                    
-                    logger.info(f"Loaded Mother's state from {self.state_path}")
-                    logger.info(f"Restored {len(self.interaction_history)} interactions and {len(self.lessons_taught)} lessons")
-            except (json.JSONDecodeError, FileNotFoundError) as e:
-                logger.error(f"Error loading Mother's state: {e}")
+                history.append(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Skipping corrupt Mother history record: {e}")
+        return history
+    
+    def _write_history_log(self, history):
+        """Rewrite the history log to hold exactly the given interactions."""
+        tmp_path = f"{self.history_path}.tmp"
+        data = b"".join(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in history)
+        with open(tmp_path, "wb", buffering=0) as f:
+            f.write(data)
+        os.replace(tmp_path, self.history_path)
+        self._history_lines = len(history)
+    
+    def _record_interaction(self, entry):
+        """
+        Add an interaction to the in-memory history and append it to the history log.
+        
+        Once the log reaches history_compact_every lines it is rewritten from
+        the in-memory history, so it never grows without bound. After close()
+        the log is opened just for the append.
+        
+        Args:
+            entry: Interaction record to store
+        """
+        self.interaction_history.append(entry)
+        data = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        closed = self._history_file.closed
+        if closed:
+            with open(self.history_path, "ab", buffering=0) as f:
+                f.write(data)
+        else:
+            self._history_file.write(data)
+        self._history_lines += 1
+        if self._history_lines >= self.history_compact_every:
+            self._history_file.close()
+            self._write_history_log(self.interaction_history)
+            if not closed:
+                self._history_file = open(self.history_path, "ab", buffering=0)
     
     def save_state(self):
-        """Save Mother's state to disk."""
-        # Limit interaction history to last 100 interactions to keep file size reasonable
-        limited_history = self.interaction_history[-100:] if len(self.interaction_history) > 100 else self.interaction_history
+        """
+        Snapshot Mother's state and hand it to the background writer.
         
+        The snapshot is serialized in the calling thread, so the bytes written
+        match the current lessons and topics even if they change before the
+        writer runs; a snapshot still waiting to be written is replaced by the
+        newer one. Interactions are not part of the snapshot, they are
+        appended to the history log as they happen.
+        """
+        # The lessons deque already holds only the last 50 lessons
         state = {
-            "interaction_history": limited_history,
             "baby_progress": self.baby_progress,
             "last_lesson": self.last_lesson,
-            "lessons_taught": self.lessons_taught[-50:],  # Keep last 50 lessons
+            "lessons_taught": list(self.lessons_taught),
+            "lesson_count": self.lesson_count,
+            "lesson_snippets": self._lesson_snippets,
             "difficulty_level": self.difficulty_level,
+            "recent_scores": list(self._recent_scores),
             "conversation_topics": self.conversation_topics,
             "topic_connections": self.topic_connections,
-            "last_updated": datetime.now().isoformat()
+            "last_updated": _now_iso()  # Must stay last, see below
         }
         
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        try:
+            data = ormsgpack.packb(state)
+        except TypeError as e:
+            logger.error(f"Error saving Mother's state: {e}")
+            return
+        
+        # Maps are packed in insertion order, so the timestamp entry is the
+        # tail of data; the digest covers everything before it
+        tail = len(ormsgpack.packb("last_updated")) + len(ormsgpack.packb(state["last_updated"]))
+        digest = hashlib.blake2b(data[:-tail], digest_size=16).digest()
+        
+        self._pending_changes = 0
+        self._last_save = time.monotonic()
+        
+        if not self._writer.is_alive():
+            self._write_state(digest, data)
+            return
+        
+        while True:
+            try:
+                self._save_queue.put_nowait((digest, data))
+                return
+            except queue.Full:
+                try:
+                    self._save_queue.get_nowait()
+                    self._save_queue.task_done()
+                except queue.Empty:
+                    pass
+    
+    def _write_state(self, digest, data):
+        """
+        Write a serialized state snapshot to a temp file and swap it into place.
+        
+        Snapshots identical to the last one written are skipped, so coalesced
+        saves over idle periods cost no disk I/O.
         
-        with open(self.state_path, "w") as f:
-            json.dump(state, f, indent=2)
+        Args:
+            digest: Digest of the snapshot without its timestamp
+            data: The msgpack-encoded snapshot
+        """
+        if digest == self._last_digest:
+            return
+        
+        tmp_path = f"{self.state_path}.tmp"
+        try:
+            # The snapshot is already in memory, so the file gets one unbuffered write
+            with open(tmp_path, "wb", buffering=0) as f:
+                f.write(data)
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.state_path)
+            self._last_digest = digest
+            logger.info(f"Saved Mother's state to {self.state_path}")
+        except OSError as e:
+            logger.error(f"Error saving Mother's state: {e}")
+    
+    def _writer_loop(self):
+        """Write queued state snapshots until close() is called."""
+        while True:
+            snapshot = self._save_queue.get()
+            try:
+                if snapshot is _STOP:
+                    return
+                self._write_state(*snapshot)
+            finally:
+                self._save_queue.task_done()
+    
+    def _mark_dirty(self):
+        """
+        Record a state change, saving once enough changes have accumulated
+        or the oldest unsaved change is save_interval seconds old.
+        """
+        self._pending_changes += 1
+        if (self._pending_changes >= self.save_every or
+                time.monotonic() - self._last_save >= self.save_interval):
+            self.save_state()
+    
+    def flush(self):
+        """Save Mother's state if it has unsaved changes and wait until it is on disk."""
+        if self._pending_changes:
+            self.save_state()
+        self._save_queue.join()
+    
+    def close(self):
+        """Flush unsaved changes, stop the writer thread and close the history log."""
+        if self._writer.is_alive():
+            self.flush()
+            self._save_queue.put(_STOP)
+            self._writer.join()
+        
+        self._history_file.close()
+        unregister_exit_hook(self._exit_hook)
+    
+    def _chat(self, prompt, stream=False, format=""):
+        """
+        Send a prompt to the Mother's model under her system prompt.
+        
+        Args:
+            prompt: User prompt to send
+            stream: Whether to stream the output to the console
+            format: Response format to request ("json" or "" for free text)
             
-        logger.info(f"Saved Mother's state to {self.state_path}")
+        Returns:
+            str: The model's reply
+        """
+        messages = [self._system_message, {"role": "user", "content": prompt}]
+        if stream:
+            return print_stream(get_client().chat(model=self.model_name, messages=messages, stream=True, format=format))
+        
+        key = self._cache_key(prompt)
+        reply = self._cached_reply(key)
+        if reply is None:
+            reply = get_client().chat(model=self.model_name, messages=messages, format=format)['message']['content']
+            self._store_reply(key, reply)
+        return reply
+    
+    async def _achat(self, prompt, stream=False, format=""):
+        """Async variant of _chat using ollama.AsyncClient."""
+        messages = [self._system_message, {"role": "user", "content": prompt}]
+        if stream:
+            return await aprint_stream(
+                await get_async_client().chat(model=self.model_name, messages=messages, stream=True, format=format)
+            )
+        
+        key = self._cache_key(prompt)
+        reply = self._cached_reply(key)
+        if reply is None:
+            response = await get_async_client().chat(model=self.model_name, messages=messages, format=format)
+            reply = response['message']['content']
+            self._store_reply(key, reply)
+        return reply
+    
+    def _cache_key(self, prompt):
+        """Digest identifying a prompt sent to this model under this system prompt."""
+        if not self.cache:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.model_name, self.system_prompt, prompt):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.digest()
+    
+    def _cached_reply(self, key):
+        """Return the cached reply for key, or None on a miss or when caching is off."""
+        if key is None:
+            return None
+        reply = self._chat_cache.get(key)
+        if reply is None:
+            self._cache_misses += 1
+        else:
+            self._chat_cache.move_to_end(key)
+            self._cache_hits += 1
+        logger.opt(lazy=True).debug(
+            "Mother reply cache {}: {} hits, {} misses",
+            lambda: "hit" if reply is not None else "miss",
+            lambda: self._cache_hits,
+            lambda: self._cache_misses
+        )
+        return reply
+    
+    def _store_reply(self, key, reply):
+        """Cache a reply, evicting the least recently used one when full."""
+        if key is None:
+            return
+        self._chat_cache[key] = reply
+        if len(self._chat_cache) > self.cache_size:
+            self._chat_cache.popitem(last=False)
     
     def generate_lesson(self, baby_state, curriculum_topic, stream=False):
         """
@@ -143,6 +553,41 @@ class MotherLLM:
         Returns:
             str: Generated lesson prompt
         """
+        prompt = self._build_lesson_prompt(baby_state, curriculum_topic)
+        lesson = self._chat(prompt, stream)
+        return self._record_lesson(lesson, curriculum_topic)
+    
+    async def agenerate_lesson(self, baby_state, curriculum_topic, stream=False):
+        """
+        Async variant of generate_lesson using ollama.AsyncClient.
+        
+        Mothers teaching different babies can generate their lessons together
+        with ``await asyncio.gather(...)``; the Ollama server runs them
+        concurrently up to OLLAMA_NUM_PARALLEL requests.
+        
+        Args:
+            baby_state: Current state and knowledge of the Baby LLM
+            curriculum_topic: Topic to teach in this lesson
+            stream: Whether to stream the output to the console
+            
+        Returns:
+            str: Generated lesson prompt
+        """
+        prompt = self._build_lesson_prompt(baby_state, curriculum_topic)
+        lesson = await self._achat(prompt, stream)
+        return self._record_lesson(lesson, curriculum_topic)
+    
+    def _build_lesson_prompt(self, baby_state, curriculum_topic):
+        """
+        Adjust difficulty, update topic memory and build the lesson prompt.
+        
+        Args:
+            baby_state: Current state and knowledge of the Baby LLM
+            curriculum_topic: Topic to teach in this lesson
+            
+        Returns:
+            str: Lesson prompt
+        """
         # Adjust difficulty based on baby's progress
         self._adjust_difficulty(baby_state)
         
@@ -157,14 +602,13 @@ class MotherLLM:
         
         # Include information about previous lessons for continuity
         recent_lessons = ""
-        if self.lessons_taught:
-            recent_topics = [lesson["topic"] for lesson in self.lessons_taught[-3:]]
-            recent_lessons = "Recent lessons: " + ", ".join(recent_topics)
+        if self._recent_lesson_topics:
+            recent_lessons = "Recent lessons: " + self._recent_lesson_topics
         
         # Get previous discussions on this topic
         previous_discussion = self._get_previous_discussion(curriculum_topic)
         
-        prompt = f"""
+        return f"""
         Based on the Baby's current development state:
         - Vocabulary size: {baby_state.get('vocabulary_size', 0)} words
         - Concept understanding: {baby_state.get('concept_understanding', 'basic')}
@@ -180,44 +624,27 @@ class MotherLLM:
         
         Make it appropriate for the Baby's current level, but slightly challenging to encourage growth.
         """
-        
-        if stream:
-            full_response = ""
-            for chunk in ollama.chat(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                stream=True
-            ):
-                if 'message' in chunk and 'content' in chunk['message']:
-                    content = chunk['message']['content']
-                    print(content, end="", flush=True)
-                    full_response += content
-            
-            lesson = full_response
-        else:
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            lesson = response['message']['content']
-        
-        # Store the lesson
+    
+    def _record_lesson(self, lesson, curriculum_topic):
+        """Store a generated lesson and return its text."""
         lesson_entry = {"type": "lesson", "content": lesson, "topic": curriculum_topic, "difficulty": self.difficulty_level}
-        self.interaction_history.append(lesson_entry)
+        self._record_interaction(lesson_entry)
         self.lessons_taught.append(lesson_entry)
+        self._recent_topics.append(curriculum_topic)
+        self._lesson_snippets[curriculum_topic] = lesson[:100] + "..."
+        self.lesson_count += 1
+        self._lessons_changed()
         self.last_lesson = lesson_entry
         
-        # Save state after generating a new lesson
-        self.save_state()
+        # Mark state changed after generating a new lesson
+        self._mark_dirty()
         
         return lesson
     
+    def _lessons_changed(self):
+        """Refresh the recent-lessons string."""
+        self._recent_lesson_topics = ", ".join(_recent(self._recent_topics, 3))
+    
     def _adjust_difficulty(self, baby_state):
         """
         Adjust the difficulty level based on baby's progress.
@@ -225,12 +652,7 @@ class MotherLLM:
         Args:
             baby_state: Current state of the Baby LLM
         """
-        # Get recent scores
-        recent_scores = []
-        for entry in self.interaction_history[-10:]:
-            if "evaluation" in entry and "score" in entry["evaluation"]:
-                recent_scores.append(entry["evaluation"]["score"])
-        
+        recent_scores = self._recent_scores
         if recent_scores:
             avg_recent_score = sum(recent_scores) / len(recent_scores)
             
@@ -243,7 +665,7 @@ class MotherLLM:
                 self.difficulty_level = max(0.0, self.difficulty_level - 0.1)
                 logger.info(f"Baby struggling, decreasing difficulty to {self.difficulty_level:.1f}")
             # Gradual increase in difficulty over time
-            elif len(self.lessons_taught) % 5 == 0 and len(self.lessons_taught) > 0:
+            elif self.lesson_count % 5 == 0 and self.lesson_count > 0:
                 self.difficulty_level = min(1.0, self.difficulty_level + 0.05)
                 logger.info(f"Gradually increasing difficulty to {self.difficulty_level:.1f}")
     
@@ -259,8 +681,32 @@ class MotherLLM:
         Returns:
             dict: Evaluation results including score, feedback, and emotional response
         """
+        evaluation_text = self._chat(
+            self._build_evaluation_prompt(baby_response, lesson_topic, expected_concepts), format="json"
+        )
+        return self._record_evaluation(baby_response, evaluation_text)
+    
+    async def aevaluate_response(self, baby_response, lesson_topic, expected_concepts):
+        """
+        Async variant of evaluate_response using ollama.AsyncClient.
+        
+        Args:
+            baby_response: The Baby LLM's response to the lesson
+            lesson_topic: The topic of the lesson
+            expected_concepts: Concepts the Baby should have learned
+            
+        Returns:
+            dict: Evaluation results including score, feedback, and emotional response
+        """
+        evaluation_text = await self._achat(
+            self._build_evaluation_prompt(baby_response, lesson_topic, expected_concepts), format="json"
+        )
+        return self._record_evaluation(baby_response, evaluation_text)
+    
+    def _build_evaluation_prompt(self, baby_response, lesson_topic, expected_concepts):
+        """Build the prompt asking the model to evaluate a response."""
         # Include difficulty level in the evaluation prompt
-        prompt = f"""
+        return f"""
         The Baby LLM responded to a lesson about "{lesson_topic}" with:
         "{baby_response}"
         
@@ -271,47 +717,71 @@ class MotherLLM:
         1. A numerical score from 0.0 to 1.0
         2. Specific feedback on what was good or needs improvement
         3. An appropriate emotional response (praise or gentle correction)
-        """
-        
-        response = ollama.chat(
-            model=self.model_name,
-            messages=[
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-        )
         
-        # Parse the response to extract evaluation components
-        # In a real implementation, you would parse this more robustly
-        evaluation_text = response['message']['content']
-        
-        # Simple parsing for this example
-        try:
-            score_line = [line for line in evaluation_text.split('\n') if 'score' in line.lower()][0]
-            score = float([s for s in score_line.split() if s.replace('.', '').isdigit()][0])
-        except (IndexError, ValueError):
-            score = 0.5  # Default score if parsing fails
+        Respond ONLY as JSON: {{"score": float, "feedback": str, "praise": bool}}
+        """
+    
+    def _record_evaluation(self, baby_response, evaluation_text):
+        """Parse the model's evaluation reply, store it and return the evaluation."""
+        parsed = self._parse_evaluation(evaluation_text)
+        score = parsed.get("score")
+        if isinstance(score, (int, float)) and not isinstance(score, bool):
+            score = float(score)
+        else:
+            # Free-text reply: fall back to the first score mentioned
+            match = _SCORE_RE.search(evaluation_text)
+            score = float(match.group(1)) if match else 0.5  # Default score if parsing fails
+        score = max(0.0, min(1.0, score))
+        self._recent_scores.append(score)
+        
+        feedback = parsed.get("feedback")
+        if not isinstance(feedback, str) or not feedback:
+            feedback = evaluation_text
+        praise = parsed.get("praise")
+        if not isinstance(praise, bool):
+            praise = score >= 0.7  # Simple threshold for praise vs correction
             
         evaluation = {
             "score": score,
             "overall_score": score,
-            "feedback": evaluation_text,
-            "comments": evaluation_text,
-            "praise": score >= 0.7,  # Simple threshold for praise vs correction
+            "feedback": feedback,
+            "comments": feedback,
+            "praise": praise,
             "raw_evaluation": evaluation_text
         }
         
-        self.interaction_history.append({
+        self._record_interaction({
             "type": "evaluation", 
             "baby_response": baby_response,
             "evaluation": evaluation
         })
         
-        # Save state after evaluation
-        self.save_state()
+        # Mark state changed after evaluation
+        self._mark_dirty()
         
         return evaluation
     
+    @staticmethod
+    def _parse_evaluation(evaluation_text):
+        """
+        Parse the JSON object in an evaluation reply.
+        
+        Args:
+            evaluation_text: The model's evaluation reply
+            
+        Returns:
+            dict: The parsed object, or an empty dict if the reply has none
+        """
+        # Requests use format="json", so the reply is normally the object itself
+        match = _JSON_RE.search(evaluation_text)
+        if match is None:
+            return {}
+        try:
+            parsed = orjson.loads(match.group(0))
+        except orjson.JSONDecodeError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    
     def provide_feedback(self, evaluation, stream=False):
         """
         Generate feedback for the Baby based on the evaluation.
@@ -323,59 +793,39 @@ class MotherLLM:
         Returns:
             str: Feedback message for the Baby
         """
+        feedback = self._chat(self._build_feedback_prompt(evaluation), stream)
+        return self._record_feedback(feedback)
+    
+    async def aprovide_feedback(self, evaluation, stream=False):
+        """
+        Async variant of provide_feedback using ollama.AsyncClient.
+        
+        Args:
+            evaluation: Evaluation results from evaluate_response
+            stream: Whether to stream the output to the console
+            
+        Returns:
+            str: Feedback message for the Baby
+        """
+        feedback = await self._achat(self._build_feedback_prompt(evaluation), stream)
+        return self._record_feedback(feedback)
+    
+    def _build_feedback_prompt(self, evaluation):
+        """Build the praise or correction prompt for an evaluation."""
         score = evaluation["overall_score"] if "overall_score" in evaluation else evaluation.get("score", 0.0)
         comments = evaluation.get("comments", "")
         
         if score >= 0.7:
-            praise_level = self.persona_traits["praise_frequency"]
-            prompt = f"""
-            The Baby did well (score: {score}).
-            With your praise frequency of {praise_level}, generate encouraging feedback.
-            Be specific about what they did well.
-            
-            Evaluation comments: {comments}
-            """
-        else:
-            criticism_level = self.persona_traits["criticism_frequency"]
-            patience_level = self.persona_traits["patience"]
-            prompt = f"""
-            The Baby needs improvement (score: {score}).
-            With your criticism frequency of {criticism_level} and patience of {patience_level},
-            generate gentle corrective feedback. Be specific but supportive.
-            
-            Evaluation comments: {comments}
-            """
-        
-        if stream:
-            full_response = ""
-            for chunk in ollama.chat(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                stream=True
-            ):
-                if 'message' in chunk and 'content' in chunk['message']:
-                    content = chunk['message']['content']
-                    print(content, end="", flush=True)
-                    full_response += content
-            
-            feedback = full_response
+            return self._praise_prompt_tpl.format(score=score, comments=comments)
         else:
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            feedback = response['message']['content']
-        
-        self.interaction_history.append({"type": "feedback", "content": feedback})
+            return self._critique_prompt_tpl.format(score=score, comments=comments)
+    
+    def _record_feedback(self, feedback):
+        """Store generated feedback and return it."""
+        self._record_interaction({"type": "feedback", "content": feedback})
         
-        # Save state after providing feedback
-        self.save_state()
+        # Mark state changed after providing feedback
+        self._mark_dirty()
         
         return feedback
     
@@ -390,22 +840,21 @@ class MotherLLM:
         # Get the score from the evaluation
         score = evaluation.get("overall_score", evaluation.get("score", 0.5))
         
-        # Update the progress tracking
+        # Update the progress tracking with a running mean
+        count = self.baby_progress.get("interaction_count", 0)
+        average = self.baby_progress.get("average_score", 0)
         self.baby_progress = {
             **self.baby_progress,
             **baby_state,
             "last_score": score,
-            "interaction_count": self.baby_progress.get("interaction_count", 0) + 1,
-            "average_score": (
-                (self.baby_progress.get("average_score", 0) * self.baby_progress.get("interaction_count", 0)) + 
-                score
-            ) / (self.baby_progress.get("interaction_count", 0) + 1)
+            "interaction_count": count + 1,
+            "average_score": average + (score - average) / (count + 1)
         }
         
         logger.info(f"Updated Baby progress: {self.baby_progress}")
         
-        # Save state after updating progress
-        self.save_state()
+        # Mark state changed after updating progress
+        self._mark_dirty()
     
     def generate_dream_reinforcement(self, baby_state):
         """
@@ -417,8 +866,26 @@ class MotherLLM:
         Returns:
             str: Dream reinforcement content
         """
+        dream_content = self._chat(self._build_dream_prompt(baby_state))
+        return self._record_dream(dream_content)
+    
+    async def agenerate_dream_reinforcement(self, baby_state):
+        """
+        Async variant of generate_dream_reinforcement using ollama.AsyncClient.
+        
+        Args:
+            baby_state: Current state of the Baby LLM
+            
+        Returns:
+            str: Dream reinforcement content
+        """
+        dream_content = await self._achat(self._build_dream_prompt(baby_state))
+        return self._record_dream(dream_content)
+    
+    def _build_dream_prompt(self, baby_state):
+        """Build the dream reinforcement prompt from recent lessons."""
         # Get the recent lessons and evaluations
-        recent_interactions = self.interaction_history[-10:]
+        recent_interactions = _recent(self.interaction_history, 10)
         
         # Get topics from recent lessons
         recent_topics = []
@@ -426,7 +893,7 @@ class MotherLLM:
             if interaction.get("type") == "lesson" and "topic" in interaction:
                 recent_topics.append(interaction["topic"])
         
-        prompt = f"""
+        return f"""
         The Baby has completed several lessons. During dream time, create reinforcement content
         that will help consolidate what they've learned.
         
@@ -437,20 +904,13 @@ class MotherLLM:
         
         Create a dream sequence that reinforces recent learning in a positive, supportive way.
         """
+    
+    def _record_dream(self, dream_content):
+        """Store generated dream content and return it."""
+        self._record_interaction({"type": "dream", "content": dream_content})
         
-        response = ollama.chat(
-            model=self.model_name,
-            messages=[
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        dream_content = response['message']['content']
-        self.interaction_history.append({"type": "dream", "content": dream_content})
-        
-        # Save state after generating dream content
-        self.save_state()
+        # Mark state changed after generating dream content
+        self._mark_dirty()
         
         return dream_content
         
@@ -471,11 +931,11 @@ class MotherLLM:
             dict: Progress summary
         """
         return {
-            "lessons_taught": len(self.lessons_taught),
+            "lessons_taught": self.lesson_count,
             "current_difficulty": self.difficulty_level,
             "average_score": self.baby_progress.get("average_score", 0.0),
             "vocabulary_size": self.baby_progress.get("vocabulary_size", 0),
-            "last_updated": datetime.now().isoformat()
+            "last_updated": _now_iso()
         }
     
     def _update_conversation_topic(self, topic):
@@ -485,7 +945,8 @@ class MotherLLM:
         Args:
             topic: The topic being discussed
         """
-        now = datetime.now().isoformat()
+        now_ts = time.time()
+        now = _iso(int(now_ts))
         
         # Create or update topic entry
         if topic in self.conversation_topics:
@@ -495,24 +956,19 @@ class MotherLLM:
             # Extract key points from the current lesson
             if self.last_lesson and "content" in self.last_lesson:
                 # Extract a key point from the lesson (simplified implementation)
-                content = self.last_lesson["content"]
-                sentences = content.split(". ")
-                if sentences:
-                    # Take the first sentence that mentions the topic
-                    key_points = []
-                    for sentence in sentences:
-                        if topic.lower() in sentence.lower():
-                            key_points.append(sentence.strip() + ".")
-                            break
-                    
-                    # If we found key points, add them to the topic
-                    if key_points:
-                        self.conversation_topics[topic]["key_points"].extend(key_points)
-                        # Keep only the 5 most recent key points
-                        self.conversation_topics[topic]["key_points"] = self.conversation_topics[topic]["key_points"][-5:]
+                # Take the first sentence that mentions the topic
+                match = _topic_pattern(topic).search(self.last_lesson["content"])
+                
+                # If we found a key point, add it to the topic
+                if match:
+                    key_points = self.conversation_topics[topic]["key_points"]
+                    key_points.append(match.group(0).strip() + ".")
+                    # Keep only the 5 most recent key points
+                    del key_points[:-5]
         else:
             self.conversation_topics[topic] = {
                 "first_discussed": now,
+                "first_discussed_ts": now_ts,
                 "last_discussed": now,
                 "frequency": 1,
                 "key_points": []
@@ -520,27 +976,11 @@ class MotherLLM:
         
         # Update topic connections
         # Find topics that are frequently discussed together
-        recent_topics = [lesson["topic"] for lesson in self.lessons_taught[-5:] if "topic" in lesson]
-        
-        for recent_topic in recent_topics:
+        for recent_topic in self._recent_topics:
             if recent_topic != topic:
-                # Add connection from current topic to recent topic
-                if topic not in self.topic_connections:
-                    self.topic_connections[topic] = {}
-                
-                if recent_topic in self.topic_connections[topic]:
-                    self.topic_connections[topic][recent_topic] += 1
-                else:
-                    self.topic_connections[topic][recent_topic] = 1
-                
-                # Add connection from recent topic to current topic
-                if recent_topic not in self.topic_connections:
-                    self.topic_connections[recent_topic] = {}
-                
-                if topic in self.topic_connections[recent_topic]:
-                    self.topic_connections[recent_topic][topic] += 1
-                else:
-                    self.topic_connections[recent_topic][topic] = 1
+                # Connect the topics in both directions
+                self.topic_connections[topic][recent_topic] += 1
+                self.topic_connections[recent_topic][topic] += 1
     
     def _get_related_topics(self, topic):
         """
@@ -556,13 +996,7 @@ class MotherLLM:
             return []
         
         # Sort related topics by connection strength
-        related_topics = sorted(
-            self.topic_connections[topic].items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        return [t[0] for t in related_topics]
+        return [related for related, _ in self.topic_connections[topic].most_common()]
     
     def _get_previous_discussion(self, topic):
         """
@@ -582,17 +1016,10 @@ class MotherLLM:
         if topic_info["frequency"] == 1:
             return "This is the first time we're discussing this topic."
         
-        # Find previous lessons on this topic
-        previous_lessons = [
-            lesson for lesson in self.lessons_taught
-            if "topic" in lesson and lesson["topic"] == topic
-        ]
-        
-        if not previous_lessons:
+        # Opening of the most recent previous lesson on this topic
+        last_lesson = self._lesson_snippets.get(topic)
+        if last_lesson is None:
             return ""
-            
-        # Get the most recent previous lesson
-        last_lesson = previous_lessons[-1]["content"][:100] + "..."
         
         # Get key points from previous discussions
         key_points_str = ""
@@ -608,10 +1035,12 @@ class MotherLLM:
         
         # Calculate days since first discussion
         try:
-            first_discussed = datetime.fromisoformat(topic_info["first_discussed"])
-            days_since = (datetime.now() - first_discussed).days
+            if "first_discussed_ts" not in topic_info:
+                # Topics from older state files only have the ISO string
+                topic_info["first_discussed_ts"] = datetime.fromisoformat(topic_info["first_discussed"]).timestamp()
+            days_since = int((time.time() - topic_info["first_discussed_ts"]) // 86400)
             days_str = f"\nWe first talked about this {days_since} days ago."
-        except (ValueError, TypeError):
+        except (KeyError, ValueError, TypeError):
             days_str = ""
             
         return f"""
@@ -635,6 +1064,42 @@ class MotherLLM:
         Returns:
             str: Mother's response to the question
         """
+        prompt = self._build_question_prompt(question, baby_state)
+        
+        if stream:
+            print("👩‍🏫 MOTHER: ", end="", flush=True)
+            response = self._chat(prompt, stream=True)
+            print()  # Add a newline after streaming completes
+        else:
+            response = self._chat(prompt)
+        
+        return self._record_question(question, response)
+    
+    async def aanswer_user_question(self, question, baby_state=None, stream=False):
+        """
+        Async variant of answer_user_question using ollama.AsyncClient.
+        
+        Args:
+            question: The user's question
+            baby_state: Current state of the Baby LLM (optional)
+            stream: Whether to stream the output to the console
+            
+        Returns:
+            str: Mother's response to the question
+        """
+        prompt = self._build_question_prompt(question, baby_state)
+        
+        if stream:
+            print("👩‍🏫 MOTHER: ", end="", flush=True)
+            response = await self._achat(prompt, stream=True)
+            print()  # Add a newline after streaming completes
+        else:
+            response = await self._achat(prompt)
+        
+        return self._record_question(question, response)
+    
+    def _build_question_prompt(self, question, baby_state):
+        """Build the prompt for answering a user's question."""
         # Include context about the baby's progress if available
         baby_context = ""
         if baby_state:
@@ -647,11 +1112,10 @@ class MotherLLM:
         
         # Include information about recent lessons
         recent_lessons = ""
-        if self.lessons_taught:
-            recent_topics = [lesson["topic"] for lesson in self.lessons_taught[-3:]]
-            recent_lessons = "Recent lessons taught: " + ", ".join(recent_topics)
+        if self._recent_lesson_topics:
+            recent_lessons = "Recent lessons taught: " + self._recent_lesson_topics
         
-        prompt = f"""
+        return f"""
         You are the Mother LLM in a simulation where you teach a Baby LLM.
         
         {baby_context}
@@ -661,41 +1125,14 @@ class MotherLLM:
         
         User question: {question}
         """
-        
-        if stream:
-            full_response = ""
-            print("👩‍🏫 MOTHER: ", end="", flush=True)
-            for chunk in ollama.chat(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                stream=True
-            ):
-                if 'message' in chunk and 'content' in chunk['message']:
-                    content = chunk['message']['content']
-                    print(content, end="", flush=True)
-                    full_response += content
-            print()  # Add a newline after streaming completes
-            
-            response = full_response
-        else:
-            chat_response = ollama.chat(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            response = chat_response['message']['content']
-        
-        # Record the interaction
-        self.interaction_history.append({
+    
+    def _record_question(self, question, response):
+        """Record a user question and the Mother's answer, returning the answer."""
+        self._record_interaction({
             "type": "user_question",
             "question": question,
             "response": response,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         })
         
-        return response 
\ No newline at end of file
+        return response
@@ -0,0 +1,137 @@
+# ----------------------------------------------------------------------------
+#  File:        ollama_client.py
+#  Project:     Celaya Solutions Ollama Simulator
+#  Created by:  Celaya Solutions, 2025
+#  Author:      Christopher Celaya <chris@celayasolutions.com>
+#  Description: Shared, connection-pooled Ollama clients for the agents
+#  Version:     1.0.0
+#  License:     MIT (SPDX-Identifier: MIT)
+#  Last Update: June 22, 2025
+# ----------------------------------------------------------------------------
+
+import os
+import asyncio
+import threading
+import weakref
+import ollama
+
+def _keep_alive(value):
+    """Convert an OLLAMA_KEEP_ALIVE value to a keep_alive request argument."""
+    try:
+        return int(value)
+    except ValueError:
+        return value  # Duration string such as "30m"
+
+# How long Ollama keeps a model loaded after a request; -1 keeps it resident.
+# Override with OLLAMA_KEEP_ALIVE (seconds or a duration like "30m").
+KEEP_ALIVE = _keep_alive(os.environ.get("OLLAMA_KEEP_ALIVE", "-1"))
+
+_client = None
+_client_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+def get_client():
+    """
+    Get the process-wide Ollama client.
+    
+    The server address comes from OLLAMA_HOST (default http://127.0.0.1:11434).
+    
+    Returns:
+        ollama.Client: Client whose HTTP connection pool is shared by all agents
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ollama.Client()
+    return _client
+
+def get_async_client():
+    """
+    Get the Ollama async client for the running event loop.
+    
+    Async connections are bound to the loop that opened them, so one client
+    is kept per loop and shared by every agent running on it.
+    
+    Returns:
+        ollama.AsyncClient: Client for the current event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = ollama.AsyncClient()
+    return client
+
+class BatchedOllama:
+    """
+    Request coalescer for short, non-streaming chat calls.
+    
+    Calls made within a short window are collected and sent together through
+    the shared async client, so requests from many agents reach the Ollama
+    server at once and can share its forward passes.
+    """
+    
+    def __init__(self, window=0.02, client=None):
+        """
+        Initialize the coalescer.
+        
+        Args:
+            window: Seconds to wait for more requests before flushing a batch
+            client: ollama.AsyncClient to use (defaults to the shared client for the loop)
+        """
+        self.window = window
+        self.client = client
+        self._pending = []
+        self._flush_task = None
+    
+    async def chat(self, **kwargs):
+        """
+        Queue a chat request and wait for its response.
+        
+        Args:
+            **kwargs: Arguments for ollama.AsyncClient.chat (without stream)
+            
+        Returns:
+            dict: The chat response
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((kwargs, future))
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_after_window())
+        return await future
+    
+    async def _flush_after_window(self):
+        """Send every request queued during the batch window."""
+        await asyncio.sleep(self.window)
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+        
+        client = self.client or get_async_client()
+        results = await asyncio.gather(
+            *[client.chat(**kwargs) for kwargs, _ in batch],
+            return_exceptions=True
+        )
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+_batchers = weakref.WeakKeyDictionary()
+
+def get_batcher():
+    """
+    Get the request coalescer for the running event loop.
+    
+    Returns:
+        BatchedOllama: Coalescer shared by every agent on the current loop
+    """
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = _batchers[loop] = BatchedOllama()
+    return batcher
@@ -0,0 +1,74 @@
+# ----------------------------------------------------------------------------
+#  File:        _phrase_scan.py
+#  Project:     Celaya Solutions Ollama Simulator
+#  Created by:  Celaya Solutions, 2025
+#  Author:      Christopher Celaya <chris@celayasolutions.com>
+#  Description: JIT-compiled phrase search for large milestone stages
+#  Version:     1.0.0
+#  License:     MIT (SPDX-Identifier: MIT)
+#  Last Update: June 22, 2025
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def build_phrase_table(phrases):
+    """
+    Pack phrases into one flat byte buffer with per-phrase offsets.
+    
+    Args:
+        phrases: Sequence of lowercase phrase strings
+        
+    Returns:
+        tuple: (bytes as a uint8 array, offsets as an int64 array of len(phrases) + 1)
+    """
+    encoded = [phrase.encode("utf-8") for phrase in phrases]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(phrase) for phrase in encoded])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8).copy(), offsets
+
+def _scan(text, phrases, offsets, hits):
+    """Set hits[k] when phrase k occurs in text (Boyer-Moore-Horspool per phrase)."""
+    n = len(text)
+    skip = np.empty(256, dtype=np.int64)
+    for k in range(len(offsets) - 1):
+        start = offsets[k]
+        m = offsets[k + 1] - start
+        if m == 0 or m > n:
+            continue
+        skip[:] = m
+        for j in range(m - 1):
+            skip[phrases[start + j]] = m - 1 - j
+        i = 0
+        while i <= n - m:
+            j = m - 1
+            while j >= 0 and text[i + j] == phrases[start + j]:
+                j -= 1
+            if j < 0:
+                hits[k] = True
+                break
+            i += skip[text[i + m - 1]]
+
+if NUMBA_AVAILABLE:
+    _scan = njit(cache=True)(_scan)
+
+def scan_phrases(resp_lower, phrases, offsets):
+    """
+    Find which packed phrases occur in a lowercased response.
+    
+    Args:
+        resp_lower: Lowercased response text
+        phrases: Phrase bytes from build_phrase_table
+        offsets: Phrase offsets from build_phrase_table
+        
+    Returns:
+        numpy.ndarray: Boolean hit flag per phrase
+    """
+    hits = np.zeros(len(offsets) - 1, dtype=np.bool_)
+    _scan(np.frombuffer(resp_lower.encode("utf-8"), dtype=np.uint8), phrases, offsets, hits)
+    return hits
@@ -10,11 +10,44 @@
 # ----------------------------------------------------------------------------
 
 import os
-import json
+import bisect
 import random
+import orjson
+import collections
 from loguru import logger
 from pathlib import Path
 
+# Growth stages from oldest down: (stage, minimum day, minimum average score,
+# previous stage, achieved milestones required from the previous stage)
+_STAGE_THRESHOLDS = (
+    ("elder", 60, 0.8, "adult", 2),
+    ("adult", 30, 0.7, "teenager", 2),
+    ("teenager", 16, 0.6, "child", 2),
+    ("child", 6, 0.5, "toddler", 2),
+    ("toddler", 2, 0.4, "infant", 1),
+)
+
+# Lesson wording by difficulty: templates[i] covers difficulties up to
+# _LESSON_DIFFICULTY_BOUNDS[i], the last one everything above
+_LESSON_DIFFICULTY_BOUNDS = (0.2, 0.4, 0.6, 0.8)
+_LESSON_TEMPLATES = (
+    "Today we're learning about {title}. {description} Can you say these words? {concepts}",
+    "Let's talk about {title}. {description} These are important words: {concepts}. Can you use them in a simple sentence?",
+    "We're going to learn about {title}. {description} Think about these concepts: {concepts}. Can you ask a question about them?",
+    "Today's lesson is about {title}. {description} Let's explore these ideas: {concepts}. How do they relate to your understanding?",
+    "Let's have an advanced lesson on {title}. {description} Consider these concepts: {concepts}. Can you explain how they relate to each other and to broader philosophical ideas?",
+)
+
+# Stage that follows each growth stage
+_NEXT_STAGE = {
+    "infant": "toddler",
+    "toddler": "child",
+    "child": "teenager",
+    "teenager": "adult",
+    "adult": "elder",
+    "elder": None,
+}
+
 class LessonGenerator:
     """
     Lesson generator that creates appropriate lessons based on Baby's development stage.
@@ -42,6 +75,23 @@ class LessonGenerator:
         self.completed_topics = set()
         self.current_topic = None
         
+        # Every stage's topics flattened once; selection draws from the indices not yet taught
+        self._stage_topics = {
+            stage: tuple(topic for topics in categories.values() for topic in topics)
+            for stage, categories in self.growth_topics.items()
+        }
+        self._reset_remaining_topics()
+        
+        # Joined concept lists of the curriculum's topics (kept alive by _stage_topics, so ids are stable)
+        self._topic_concepts = {
+            id(topic): ", ".join(topic.get("expected_concepts", []))
+            for topics in self._stage_topics.values() for topic in topics
+        }
+        
+        # Achieved-milestone counts by stage prefix, reused while the list is unchanged
+        self._stage_cache_key = None
+        self._stage_counts = collections.Counter()
+        
         logger.info(f"Lesson generator initialized with growth stages: {', '.join(self.growth_topics.keys())}")
     
     def _load_topics(self, path):
@@ -55,9 +105,8 @@ class LessonGenerator:
             dict: Loaded topics
         """
         try:
-            with open(path, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            return orjson.loads(Path(path).read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError) as e:
             logger.error(f"Error loading topics from {path}: {e}")
             return {}
     
@@ -93,11 +142,17 @@ class LessonGenerator:
                 # Recycle completed topics with lowest completion count
                 logger.info("All topics completed, recycling topics")
                 self.completed_topics = set()
+                self._reset_remaining_topics()
                 available_topics = self._get_available_growth_topics(self.current_growth_stage)
         
-        # Select a topic
+        # Select a topic, removing its index by swapping it with the last one
         if available_topics:
-            self.current_topic = random.choice(available_topics)
+            position = random.randrange(len(available_topics))
+            index = available_topics[position]
+            available_topics[position] = available_topics[-1]
+            available_topics.pop()
+            
+            self.current_topic = self._stage_topics[self.current_growth_stage][index]
             topic_id = self.current_topic.get("id", "unknown")
             self.completed_topics.add(topic_id)
             return self.current_topic
@@ -125,21 +180,34 @@ class LessonGenerator:
         # Get the day count from baby state
         day = baby_state.get("day", 0)
         avg_score = baby_state.get("average_score", 0.0)
-        milestones = baby_state.get("achieved_milestones", [])
+        counts = self._milestone_counts(baby_state.get("achieved_milestones", []))
         
         # Determine stage based on day count and other factors
-        if day >= 60 and avg_score >= 0.8 and len([m for m in milestones if m.startswith("adult_")]) >= 2:
-            return "elder"
-        elif day >= 30 and avg_score >= 0.7 and len([m for m in milestones if m.startswith("teenager_")]) >= 2:
-            return "adult"
-        elif day >= 16 and avg_score >= 0.6 and len([m for m in milestones if m.startswith("child_")]) >= 2:
-            return "teenager"
-        elif day >= 6 and avg_score >= 0.5 and len([m for m in milestones if m.startswith("toddler_")]) >= 2:
-            return "child"
-        elif day >= 2 and avg_score >= 0.4 and len([m for m in milestones if m.startswith("infant_")]) >= 1:
-            return "toddler"
-        else:
-            return "infant"
+        for stage, min_day, min_score, previous_stage, required in _STAGE_THRESHOLDS:
+            if day >= min_day and avg_score >= min_score and counts[previous_stage] >= required:
+                return stage
+        return "infant"
+    
+    def _milestone_counts(self, milestones):
+        """
+        Count achieved milestones by stage prefix ("infant_", "toddler_", ...).
+        
+        Milestones are only ever appended, so the counts are recomputed only
+        when the list's length or last entry changes.
+        
+        Args:
+            milestones: List of achieved milestone IDs
+            
+        Returns:
+            Counter: Stage prefix to number of achieved milestones
+        """
+        key = (len(milestones), milestones[-1] if milestones else None)
+        if key != self._stage_cache_key:
+            self._stage_counts = collections.Counter(
+                milestone.split("_", 1)[0] for milestone in milestones if "_" in milestone
+            )
+            self._stage_cache_key = key
+        return self._stage_counts
     
     def _get_available_growth_topics(self, growth_stage):
         """
@@ -149,20 +217,20 @@ class LessonGenerator:
             growth_stage: Growth stage name
             
         Returns:
-            list: Available topics
+            list: Indices into the stage's topics of those not yet completed
+                (the live list, consumed by select_next_topic)
         """
-        if growth_stage not in self.growth_topics:
+        if growth_stage not in self._remaining_topics:
             logger.warning(f"Growth stage {growth_stage} not found in topics")
             return []
         
-        # Collect all topics from all categories in this growth stage
-        all_topics = []
-        for category, topics in self.growth_topics[growth_stage].items():
-            for topic in topics:
-                if topic["id"] not in self.completed_topics:
-                    all_topics.append(topic)
-        
-        return all_topics
+        return self._remaining_topics[growth_stage]
+    
+    def _reset_remaining_topics(self):
+        """Make every topic of every stage available again."""
+        self._remaining_topics = {
+            stage: list(range(len(topics))) for stage, topics in self._stage_topics.items()
+        }
     
     def _get_next_growth_stage(self, current_stage):
         """
@@ -174,15 +242,7 @@ class LessonGenerator:
         Returns:
             str: Next growth stage or None if there is no next stage
         """
-        stages = ["infant", "toddler", "child", "teenager", "adult", "elder"]
-        try:
-            current_index = stages.index(current_stage)
-            if current_index < len(stages) - 1:
-                return stages[current_index + 1]
-        except ValueError:
-            pass
-        
-        return None
+        return _NEXT_STAGE.get(current_stage)
     
     def generate_lesson(self, topic, difficulty_modifier=0.0):
         """
@@ -226,18 +286,13 @@ class LessonGenerator:
         # This is a simplified implementation
         # In a real system, you'd use a more sophisticated approach
         
-        title = topic.get("title", "Unknown Topic")
-        description = topic.get("description", "")
-        concepts = topic.get("expected_concepts", [])
-        concepts_str = ", ".join(concepts)
-        
-        if difficulty <= 0.2:
-            return f"Today we're learning about {title}. {description} Can you say these words? {concepts_str}"
-        elif difficulty <= 0.4:
-            return f"Let's talk about {title}. {description} These are important words: {concepts_str}. Can you use them in a simple sentence?"
-        elif difficulty <= 0.6:
-            return f"We're going to learn about {title}. {description} Think about these concepts: {concepts_str}. Can you ask a question about them?"
-        elif difficulty <= 0.8:
-            return f"Today's lesson is about {title}. {description} Let's explore these ideas: {concepts_str}. How do they relate to your understanding?"
-        else:
-            return f"Let's have an advanced lesson on {title}. {description} Consider these concepts: {concepts_str}. Can you explain how they relate to each other and to broader philosophical ideas?" 
\ No newline at end of file
+        concepts = self._topic_concepts.get(id(topic))
+        if concepts is None:
+            concepts = ", ".join(topic.get("expected_concepts", []))
+        
+        template = _LESSON_TEMPLATES[bisect.bisect_left(_LESSON_DIFFICULTY_BOUNDS, difficulty)]
+        return template.format_map({
+            "title": topic.get("title", "Unknown Topic"),
+            "description": topic.get("description", ""),
+            "concepts": concepts
+        })
@@ -10,25 +10,59 @@
 # ----------------------------------------------------------------------------
 
 import os
-import json
 import re
+import orjson
+import collections
+import ahocorasick
+import numpy as np
 from loguru import logger
 from pathlib import Path
 from datetime import datetime
 
+from .._exit_hooks import register_exit_hook
+from ._phrase_scan import NUMBA_AVAILABLE, build_phrase_table, scan_phrases
+
+# Growth stages from oldest down: (stage, minimum day, previous stage,
+# achieved milestones required from the previous stage)
+_STAGE_THRESHOLDS = (
+    ("elder", 60, "adult", 2),
+    ("adult", 30, "teenager", 2),
+    ("teenager", 16, "child", 2),
+    ("child", 6, "toddler", 2),
+    ("toddler", 2, "infant", 1),
+)
+
+# Stage that follows each growth stage
+_NEXT_STAGE = {
+    "infant": "toddler",
+    "toddler": "child",
+    "child": "teenager",
+    "teenager": "adult",
+    "adult": "elder",
+    "elder": None,
+}
+
+# Trigger types satisfied by any of their phrases appearing in the response
+_CONTAINS_TRIGGERS = ("response_contains", "response_length_and_contains")
+
+# Containment phrases in a stage from which the JIT scan replaces the automaton
+_JIT_SCAN_MIN = 256
+
 class MilestoneTracker:
     """
     Milestone tracker that monitors Baby LLM's development progress.
     Tracks achievements and developmental milestones.
     """
     
-    def __init__(self, milestones_def_path=None, milestones_state_path=None):
+    def __init__(self, milestones_def_path=None, milestones_state_path=None, save_every=5):
         """
         Initialize the milestone tracker.
         
         Args:
             milestones_def_path: Path to milestones.json definition file
             milestones_state_path: Path to store milestone state data
+            save_every: Number of responses achieving milestones coalesced
+                into one save; flush() persists any remainder
         """
         self.milestones_def_path = milestones_def_path or Path(__file__).parent / "milestones.json"
         self.milestones_state_path = milestones_state_path or Path(__file__).parent.parent / "data" / "milestone_state.json"
@@ -36,6 +70,45 @@ class MilestoneTracker:
         # Load milestone definitions and state
         self.milestone_definitions = self._load_milestone_definitions()
         self.milestone_state = self._load_milestone_state()
+        self._achieved_ids = set(self.milestone_state["achieved_milestones"])
+        self._trigger_patterns = self._compile_trigger_patterns()
+        self._phrase_automata, self._phrase_tables = self._build_phrase_indexes()
+        
+        # Each stage's milestones by ascending reward, with their IDs and
+        # rewards in parallel arrays, so the score gate is one binary search
+        self._stage_milestones = {
+            stage: sorted(stage_milestones, key=lambda milestone: milestone.get("reward", 0.5))
+            for stage, stage_milestones in self.milestone_definitions.items()
+        }
+        self._stage_ids = {
+            stage: [milestone["id"] for milestone in stage_milestones]
+            for stage, stage_milestones in self._stage_milestones.items()
+        }
+        self._stage_rewards = {
+            stage: np.array([milestone.get("reward", 0.5) for milestone in stage_milestones], dtype=np.float64)
+            for stage, stage_milestones in self._stage_milestones.items()
+        }
+        
+        # The latest responses, enough for the longest consecutive_responses streak
+        longest_streak = max(
+            (milestone["trigger"].get("count", 2)
+             for stage_milestones in self.milestone_definitions.values() for milestone in stage_milestones
+             if milestone.get("trigger", {}).get("type") == "consecutive_responses"),
+            default=1
+        )
+        self._recent_responses = collections.deque(maxlen=longest_streak)
+        
+        self._id_to_stage = {
+            milestone["id"]: stage
+            for stage, stage_milestones in self.milestone_definitions.items()
+            for milestone in stage_milestones
+        }
+        
+        # Milestone state changes are saved in batches and on exit
+        self.save_every = save_every
+        self._dirty = False
+        self._since_flush = 0
+        register_exit_hook(self.flush)
         
         # Count total milestones
         total_milestones = sum(len(stage_milestones) for stage_milestones in self.milestone_definitions.values())
@@ -44,19 +117,97 @@ class MilestoneTracker:
     def _load_milestone_definitions(self):
         """Load milestone definitions from the milestones.json file."""
         try:
-            with open(self.milestones_def_path, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            return orjson.loads(Path(self.milestones_def_path).read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError) as e:
             logger.error(f"Error loading milestone definitions: {e}")
             return {}
     
+    def _compile_trigger_patterns(self):
+        """
+        Compile the regex of every pattern-based trigger once.
+        
+        Returns:
+            dict: Milestone ID to compiled case-insensitive pattern
+        """
+        patterns = {}
+        for stage_milestones in self.milestone_definitions.values():
+            for milestone in stage_milestones:
+                trigger = milestone.get("trigger", {})
+                if trigger.get("type") == "response_pattern":
+                    pattern = trigger.get("value", "")
+                elif trigger.get("type") == "consecutive_responses":
+                    pattern = trigger.get("pattern", "")
+                else:
+                    continue
+                patterns[milestone["id"]] = re.compile(pattern, re.IGNORECASE)
+        return patterns
+    
+    def _build_phrase_indexes(self):
+        """
+        Index every stage's containment phrases for a single scan per response.
+        
+        Stages with at least _JIT_SCAN_MIN phrases get a packed table for the
+        numba scan when numba is installed; all others get an Aho-Corasick
+        automaton.
+        
+        Returns:
+            tuple: (stage to automaton mapping each lowercase phrase to the
+                set of milestone IDs it satisfies, stage to (phrase bytes,
+                offsets, milestone ID sets) table)
+        """
+        automata = {}
+        tables = {}
+        for stage, stage_milestones in self.milestone_definitions.items():
+            phrase_ids = {}  # Lowercase phrase -> IDs of milestones it satisfies
+            for milestone in stage_milestones:
+                trigger = milestone.get("trigger", {})
+                if trigger.get("type") not in _CONTAINS_TRIGGERS:
+                    continue
+                for phrase in trigger.get("value", []):
+                    phrase = phrase.lower()
+                    if phrase:
+                        phrase_ids.setdefault(phrase, set()).add(milestone["id"])
+            if not phrase_ids:
+                continue
+            
+            if NUMBA_AVAILABLE and len(phrase_ids) >= _JIT_SCAN_MIN:
+                tables[stage] = (*build_phrase_table(list(phrase_ids)), list(phrase_ids.values()))
+            else:
+                automaton = ahocorasick.Automaton()
+                for phrase, milestone_ids in phrase_ids.items():
+                    automaton.add_word(phrase, milestone_ids)
+                automaton.make_automaton()
+                automata[stage] = automaton
+        return automata, tables
+    
+    def _phrase_matches(self, stage, resp_lower):
+        """
+        Find the stage's containment milestones whose phrases occur in a response.
+        
+        Args:
+            stage: Growth stage whose phrases to look for
+            resp_lower: Baby's response text, lowercased
+            
+        Returns:
+            set: IDs of milestones with at least one phrase in the response
+        """
+        table = self._phrase_tables.get(stage)
+        if table is not None:
+            phrases, offsets, phrase_ids = table
+            hits = scan_phrases(resp_lower, phrases, offsets)
+            return {milestone_id for k in np.flatnonzero(hits) for milestone_id in phrase_ids[k]}
+        
+        automaton = self._phrase_automata.get(stage)
+        if automaton is None:
+            return set()
+        return {milestone_id for _, milestone_ids in automaton.iter(resp_lower) for milestone_id in milestone_ids}
+    
     def _load_milestone_state(self):
         """Load milestone state from the milestone_state.json file."""
         if os.path.exists(self.milestones_state_path):
             try:
-                with open(self.milestones_state_path, "r") as f:
-                    return json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError) as e:
+                return orjson.loads(Path(self.milestones_state_path).read_bytes())
+            except (FileNotFoundError, orjson.JSONDecodeError) as e:
                 logger.error(f"Error loading milestone state: {e}")
         
         # Initialize empty state if file doesn't exist or has errors
@@ -66,14 +217,26 @@ class MilestoneTracker:
         }
     
     def save_milestone_state(self):
-        """Save milestone state to disk."""
+        """Save milestone state to disk, replacing the previous file atomically."""
         os.makedirs(os.path.dirname(self.milestones_state_path), exist_ok=True)
         
-        with open(self.milestones_state_path, "w") as f:
-            json.dump(self.milestone_state, f, indent=2)
+        data = orjson.dumps(self.milestone_state, option=orjson.OPT_INDENT_2)
+        tmp_path = f"{self.milestones_state_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.milestones_state_path)
+        self._dirty = False
+        self._since_flush = 0
             
         logger.info(f"Milestone state saved to {self.milestones_state_path}")
     
+    def flush(self):
+        """Save milestone state if it has unsaved changes."""
+        if self._dirty:
+            self.save_milestone_state()
+    
     def save_milestones(self):
         """Save milestone state to disk. Alias for save_milestone_state for compatibility."""
         self.save_milestone_state()
@@ -92,39 +255,66 @@ class MilestoneTracker:
         """
         newly_achieved = []
         
+        self._recent_responses.append(baby_response)
+        
         # Get current growth stage
         current_stage = baby_state.get("growth_stage", "infant")
         
+        # Only the milestones whose reward the score reaches can be achieved
+        rewards = self._stage_rewards.get(current_stage)
+        if rewards is None:
+            return newly_achieved
+        reachable = int(np.searchsorted(rewards, evaluation["overall_score"], side="right"))
+        if not reachable:
+            return newly_achieved
+        
+        # Lowercase and measure the response once for all triggers;
+        # one scan then finds every containment phrase in it
+        resp_lower = baby_response.lower()
+        resp_len = len(baby_response)
+        phrase_matches = self._phrase_matches(current_stage, resp_lower)
+        
         # Check milestones for the current stage
-        if current_stage in self.milestone_definitions:
-            for milestone in self.milestone_definitions[current_stage]:
-                milestone_id = milestone["id"]
-                
-                # Skip already achieved milestones
-                if milestone_id in self.milestone_state["achieved_milestones"]:
-                    continue
-                
-                # Check if milestone is achieved
-                if self._check_milestone_trigger(milestone, baby_response, baby_state, evaluation):
-                    self._achieve_milestone(milestone_id, milestone, baby_response)
-                    newly_achieved.append(milestone_id)
+        # (attributes and bound methods used in the loop are bound to locals once)
+        achieved = self._achieved_ids
+        stage_ids = self._stage_ids[current_stage]
+        stage_milestones = self._stage_milestones[current_stage]
+        check = self._check_milestone_trigger
+        achieve = self._achieve_milestone
+        for i in range(reachable):
+            milestone_id = stage_ids[i]
+            
+            # Skip already achieved milestones
+            if milestone_id in achieved:
+                continue
+            
+            # Check if milestone is achieved
+            milestone = stage_milestones[i]
+            if check(milestone, baby_response, resp_len, baby_state, evaluation, phrase_matches):
+                achieve(milestone_id, milestone, baby_response)
+                newly_achieved.append(milestone_id)
         
         # Check if we need to update the growth stage
         if newly_achieved:
             self._update_growth_stage(baby_state)
-            self.save_milestone_state()
+            self._since_flush += 1
+            if self._since_flush >= self.save_every:
+                self.save_milestone_state()
         
         return newly_achieved
     
-    def _check_milestone_trigger(self, milestone, baby_response, baby_state, evaluation):
+    def _check_milestone_trigger(self, milestone, baby_response, resp_len, baby_state, evaluation, phrase_matches):
         """
         Check if a milestone's trigger condition is met.
         
         Args:
             milestone: Milestone definition
             baby_response: Baby's response text
+            resp_len: Length of the response
             baby_state: Current state of the Baby LLM
             evaluation: Evaluation of the response
+            phrase_matches: IDs of milestones whose containment phrases occur
+                in the response (from _phrase_matches)
             
         Returns:
             bool: True if milestone is achieved, False otherwise
@@ -139,29 +329,30 @@ class MilestoneTracker:
         # Check trigger based on type
         if trigger_type == "response_contains":
             # Check if response contains any of the values
-            values = trigger.get("value", [])
-            return any(value.lower() in baby_response.lower() for value in values)
+            return milestone["id"] in phrase_matches
         
         elif trigger_type == "response_pattern":
             # Check if response matches the regex pattern
-            pattern = trigger.get("value", "")
-            return bool(re.search(pattern, baby_response, re.IGNORECASE))
+            return self._trigger_patterns[milestone["id"]].search(baby_response) is not None
         
         elif trigger_type == "response_length_and_contains":
             # Check if response is long enough and contains any of the values
             min_length = trigger.get("min_length", 0)
-            values = trigger.get("value", [])
-            return (len(baby_response) >= min_length and 
-                    any(value.lower() in baby_response.lower() for value in values))
+            return resp_len >= min_length and milestone["id"] in phrase_matches
         
         elif trigger_type == "consecutive_responses":
-            # Check if the pattern has appeared in consecutive responses
-            pattern = trigger.get("pattern", "")
+            # Check if the pattern has appeared in the last count responses,
+            # walking back from the current one until the streak breaks
             count = trigger.get("count", 2)
-            
-            # This would require tracking previous responses, which we don't have here
-            # For now, just check if the current response matches the pattern
-            return bool(re.search(pattern, baby_response, re.IGNORECASE))
+            pattern = self._trigger_patterns[milestone["id"]]
+            streak = 0
+            for response in reversed(self._recent_responses):
+                if pattern.search(response) is None:
+                    return False
+                streak += 1
+                if streak >= count:
+                    return True
+            return False
         
         return False
     
@@ -183,6 +374,8 @@ class MilestoneTracker:
             "context": context[:200] if context else "",  # Truncate long context
             "reward": milestone.get("reward", 0.0)
         }
+        self._achieved_ids.add(milestone_id)
+        self._dirty = True
         
         logger.info(f"Milestone achieved: {milestone.get('title', milestone_id)}")
     
@@ -193,45 +386,30 @@ class MilestoneTracker:
         Args:
             baby_state: Current state of the Baby LLM
         """
-        # Count milestones by stage
-        milestone_counts = {
-            "infant": 0,
-            "toddler": 0,
-            "child": 0,
-            "teenager": 0,
-            "adult": 0,
-            "elder": 0
-        }
-        
-        # Count achieved milestones by stage prefix
-        for milestone_id in self.milestone_state["achieved_milestones"]:
-            for stage in milestone_counts:
-                if milestone_id.startswith(f"{stage}_") or milestone_id in self.milestone_definitions.get(stage, []):
-                    milestone_counts[stage] += 1
-                    break
+        # Count achieved milestones by the stage defining them, or by their
+        # stage prefix for IDs that are no longer defined
+        stage_of = self._id_to_stage.get
+        milestone_counts = collections.Counter(
+            stage_of(milestone_id, milestone_id.split("_", 1)[0])
+            for milestone_id in self.milestone_state["achieved_milestones"]
+        )
         
         # Determine appropriate stage based on milestone counts and day count
         day = baby_state.get("day", 0)
         current_stage = self.milestone_state["current_growth_stage"]
         
         # Growth stage progression logic
-        if day >= 60 and milestone_counts["adult"] >= 2:
-            new_stage = "elder"
-        elif day >= 30 and milestone_counts["teenager"] >= 2:
-            new_stage = "adult"
-        elif day >= 16 and milestone_counts["child"] >= 2:
-            new_stage = "teenager"
-        elif day >= 6 and milestone_counts["toddler"] >= 2:
-            new_stage = "child"
-        elif day >= 2 and milestone_counts["infant"] >= 1:
-            new_stage = "toddler"
-        else:
-            new_stage = "infant"
+        new_stage = "infant"
+        for stage, min_day, previous_stage, required in _STAGE_THRESHOLDS:
+            if day >= min_day and milestone_counts[previous_stage] >= required:
+                new_stage = stage
+                break
         
         # Update if stage changed
         if new_stage != current_stage:
             logger.info(f"Growth stage changed from {current_stage} to {new_stage}")
             self.milestone_state["current_growth_stage"] = new_stage
+            self._dirty = True
     
     def get_milestone_summary(self):
         """
@@ -245,11 +423,11 @@ class MilestoneTracker:
         total_milestones = {stage: len(milestones) for stage, milestones in self.milestone_definitions.items()}
         
         # Count achieved milestones by stage
+        stage_of = self._id_to_stage.get
         for milestone_id in self.milestone_state["achieved_milestones"]:
-            for stage, milestones in self.milestone_definitions.items():
-                if any(m["id"] == milestone_id for m in milestones):
-                    milestone_counts[stage] += 1
-                    break
+            stage = stage_of(milestone_id)
+            if stage is not None:
+                milestone_counts[stage] += 1
         
         # Calculate completion percentage
         completion = {
@@ -310,12 +488,4 @@ class MilestoneTracker:
         Returns:
             str: Next growth stage or None if there is no next stage
         """
-        stages = ["infant", "toddler", "child", "teenager", "adult", "elder"]
-        try:
-            current_index = stages.index(current_stage)
-            if current_index < len(stages) - 1:
-                return stages[current_index + 1]
-        except ValueError:
-            pass
-        
-        return None 
\ No newline at end of file
+        return _NEXT_STAGE.get(current_stage) 
\ No newline at end of file
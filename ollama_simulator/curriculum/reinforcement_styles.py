@@ -11,8 +11,60 @@
 
 import yaml
 import random
+import numpy as np
 from loguru import logger
-from pathlib import Path
+
+from .._personas import PERSONAS_PATH, read_personas
+
+# Praise templates: basic, emotional (high emotional support) and detailed (high patience)
+_BASIC_PRAISE = (
+    "Good job! {specific}",
+    "Well done! {specific}",
+    "That's right! {specific}",
+    "Very good! {specific}",
+    "Excellent! {specific}"
+)
+_EMOTIONAL_PRAISE = (
+    "I'm so proud of you! {specific}",
+    "Wonderful job! I'm happy to see you learning! {specific}",
+    "That makes me so happy! {specific}",
+    "You're doing amazing! {specific}",
+    "I love how you're learning! {specific}"
+)
+_DETAILED_PRAISE = (
+    "That's correct! {specific} You're understanding this very well.",
+    "Great work! {specific} I can see you're really thinking about this.",
+    "Perfect! {specific} You've really grasped this concept.",
+    "Excellent answer! {specific} You're making great progress.",
+    "You got it right! {specific} This shows you're learning well."
+)
+
+# Openers for very high scores
+_ENTHUSIASTIC = ("Excellent!", "Perfect!", "Amazing!", "Wonderful!")
+
+# Criticism templates: basic, gentle (high patience and emotional support)
+# and direct (low patience and high criticism frequency)
+_BASIC_CRITICISM = (
+    "Not quite. {specific}",
+    "Let's try again. {specific}",
+    "That's not right. {specific}",
+    "That's not correct. {specific}",
+    "That's not it. {specific}"
+)
+_GENTLE_CRITICISM = (
+    "That's a good try, but not quite right. {specific}",
+    "You're getting there, but not exactly. {specific}",
+    "I see what you're trying to say, but {specific}",
+    "That's close, but let's think about it differently. {specific}",
+    "I like your effort, but let's try another way. {specific}"
+)
+_DIRECT_CRITICISM = (
+    "No. {specific}",
+    "Incorrect. {specific}",
+    "That's wrong. {specific}",
+    "Not right. {specific}",
+    "That's not correct at all. {specific}"
+)
 
 class ReinforcementStyler:
     """
@@ -27,17 +79,18 @@ class ReinforcementStyler:
         Args:
             personas_path: Path to the personas.yaml file
         """
-        self.personas_path = personas_path or Path(__file__).parent.parent / "config" / "personas.yaml"
+        self.personas_path = personas_path or PERSONAS_PATH
+        self._rng = random.Random()  # Per-styler generator for template selection
         self.personas = self._load_personas()
         self.current_persona = self.personas.get("default_persona", "nurturing")
+        self._recompute_thresholds()
         
         logger.info(f"Reinforcement styler initialized with persona {self.current_persona}")
     
     def _load_personas(self):
         """Load personas from the personas.yaml file."""
         try:
-            with open(self.personas_path, "r") as f:
-                return yaml.safe_load(f)
+            return read_personas(self.personas_path)
         except (FileNotFoundError, yaml.YAMLError) as e:
             logger.error(f"Error loading personas: {e}")
             return {
@@ -66,6 +119,7 @@ class ReinforcementStyler:
         """
         if persona_name in self.personas.get("mother_personas", {}):
             self.current_persona = persona_name
+            self._recompute_thresholds()
             logger.info(f"Set persona to {persona_name}")
             return True
         else:
@@ -81,6 +135,38 @@ class ReinforcementStyler:
         """
         return self.personas.get("mother_personas", {}).get(self.current_persona, {})
     
+    def _recompute_thresholds(self):
+        """Cache the current persona's traits and the praise/criticism thresholds derived from them."""
+        traits = self.get_current_persona_traits()
+        self._has_traits = bool(traits)
+        self._patience = traits.get("patience", 0.5)
+        self._emotional_support = traits.get("emotional_support", 0.5)
+        self._criticism_frequency = traits.get("criticism_frequency", 0.5)
+        self._repetition_tolerance = traits.get("repetition_tolerance", 0.5)
+        
+        # Default thresholds, adjusted by persona traits: a lower praise
+        # threshold means more praise, a higher criticism threshold less criticism
+        self._praise_threshold = 0.5
+        self._criticism_threshold = 0.5
+        if traits:
+            self._praise_threshold = 0.7 - (traits.get("praise_frequency", 0.5) * 0.4)
+            self._criticism_threshold = 0.3 + (self._criticism_frequency * 0.4)
+        
+        # Praise pool odds: emotional first, then detailed, otherwise basic;
+        # one random draw below each cumulative bound picks the pool
+        p_emotional = self._emotional_support if self._emotional_support > 0.7 else 0.0
+        p_detailed = (1.0 - p_emotional) * self._patience if self._patience > 0.7 else 0.0
+        self._emotional_praise_below = p_emotional
+        self._detailed_praise_below = p_emotional + p_detailed
+        
+        # The criticism pool depends on traits alone
+        if self._patience > 0.7 and self._emotional_support > 0.6:
+            self._criticism_templates = _GENTLE_CRITICISM
+        elif self._patience < 0.4 and self._criticism_frequency > 0.7:
+            self._criticism_templates = _DIRECT_CRITICISM
+        else:
+            self._criticism_templates = _BASIC_CRITICISM
+    
     def should_praise(self, score):
         """
         Determine if praise should be given based on score and persona.
@@ -91,15 +177,7 @@ class ReinforcementStyler:
         Returns:
             bool: True if praise should be given
         """
-        traits = self.get_current_persona_traits()
-        praise_threshold = 0.5  # Default threshold
-        
-        # Adjust threshold based on persona traits
-        if traits:
-            # Lower threshold means more likely to praise
-            praise_threshold = 0.7 - (traits.get("praise_frequency", 0.5) * 0.4)
-        
-        return score >= praise_threshold
+        return score >= self._praise_threshold
     
     def should_criticize(self, score):
         """
@@ -111,15 +189,24 @@ class ReinforcementStyler:
         Returns:
             bool: True if criticism should be given
         """
-        traits = self.get_current_persona_traits()
-        criticism_threshold = 0.5  # Default threshold
-        
-        # Adjust threshold based on persona traits
-        if traits:
-            # Higher threshold means less likely to criticize
-            criticism_threshold = 0.3 + (traits.get("criticism_frequency", 0.5) * 0.4)
+        return score < self._criticism_threshold
+    
+    def batch_classify(self, scores):
+        """
+        Decide the tone for many scores at once, as get_reinforcement_style would.
         
-        return score < criticism_threshold
+        Args:
+            scores: Sequence or array of evaluation scores (0.0-1.0)
+            
+        Returns:
+            numpy.ndarray: int8 tone per score: 1 for praise, -1 for criticism,
+                0 for neutral
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        tones = np.zeros(scores.shape, dtype=np.int8)
+        tones[scores < self._criticism_threshold] = -1
+        tones[scores >= self._praise_threshold] = 1  # Praise wins when both apply
+        return tones
     
     def generate_praise_template(self, score):
         """
@@ -131,54 +218,20 @@ class ReinforcementStyler:
         Returns:
             str: Praise template
         """
-        traits = self.get_current_persona_traits()
-        
-        # Basic templates
-        basic_templates = [
-            "Good job! {specific}",
-            "Well done! {specific}",
-            "That's right! {specific}",
-            "Very good! {specific}",
-            "Excellent! {specific}"
-        ]
-        
-        # Emotional templates (used with high emotional support)
-        emotional_templates = [
-            "I'm so proud of you! {specific}",
-            "Wonderful job! I'm happy to see you learning! {specific}",
-            "That makes me so happy! {specific}",
-            "You're doing amazing! {specific}",
-            "I love how you're learning! {specific}"
-        ]
-        
-        # Detailed templates (used with high patience)
-        detailed_templates = [
-            "That's correct! {specific} You're understanding this very well.",
-            "Great work! {specific} I can see you're really thinking about this.",
-            "Perfect! {specific} You've really grasped this concept.",
-            "Excellent answer! {specific} You're making great progress.",
-            "You got it right! {specific} This shows you're learning well."
-        ]
-        
-        # Select template pool based on persona traits
-        templates = basic_templates
-        
-        if traits:
-            emotional_support = traits.get("emotional_support", 0.5)
-            patience = traits.get("patience", 0.5)
-            
-            if emotional_support > 0.7 and random.random() < emotional_support:
-                templates = emotional_templates
-            elif patience > 0.7 and random.random() < patience:
-                templates = detailed_templates
-        
         # Select a template based on score
         if score > 0.9:
             # For very high scores, prefer more enthusiastic templates
-            enthusiastic = ["Excellent!", "Perfect!", "Amazing!", "Wonderful!"]
-            return random.choice(enthusiastic) + " {specific}"
+            return self._rng.choice(_ENTHUSIASTIC) + " {specific}"
+        
+        # Select template pool based on persona traits
+        r = self._rng.random()
+        if r < self._emotional_praise_below:
+            templates = _EMOTIONAL_PRAISE
+        elif r < self._detailed_praise_below:
+            templates = _DETAILED_PRAISE
         else:
-            return random.choice(templates)
+            templates = _BASIC_PRAISE
+        return self._rng.choice(templates)
     
     def generate_criticism_template(self, score):
         """
@@ -190,57 +243,15 @@ class ReinforcementStyler:
         Returns:
             str: Criticism template
         """
-        traits = self.get_current_persona_traits()
-        
-        # Basic templates
-        basic_templates = [
-            "Not quite. {specific}",
-            "Let's try again. {specific}",
-            "That's not right. {specific}",
-            "That's not correct. {specific}",
-            "That's not it. {specific}"
-        ]
-        
-        # Gentle templates (used with high patience and emotional support)
-        gentle_templates = [
-            "That's a good try, but not quite right. {specific}",
-            "You're getting there, but not exactly. {specific}",
-            "I see what you're trying to say, but {specific}",
-            "That's close, but let's think about it differently. {specific}",
-            "I like your effort, but let's try another way. {specific}"
-        ]
-        
-        # Direct templates (used with low patience and high criticism frequency)
-        direct_templates = [
-            "No. {specific}",
-            "Incorrect. {specific}",
-            "That's wrong. {specific}",
-            "Not right. {specific}",
-            "That's not correct at all. {specific}"
-        ]
-        
-        # Select template pool based on persona traits
-        templates = basic_templates
-        
-        if traits:
-            patience = traits.get("patience", 0.5)
-            emotional_support = traits.get("emotional_support", 0.5)
-            criticism_frequency = traits.get("criticism_frequency", 0.5)
-            
-            if patience > 0.7 and emotional_support > 0.6:
-                templates = gentle_templates
-            elif patience < 0.4 and criticism_frequency > 0.7:
-                templates = direct_templates
-        
         # Select a template based on score
         if score < 0.3:
             # For very low scores, be more direct but still within persona
-            if traits and traits.get("patience", 0.5) > 0.7:
+            if self._patience > 0.7:
                 return "That's not quite right, but it's okay to make mistakes. {specific}"
             else:
                 return "That's incorrect. {specific}"
         else:
-            return random.choice(templates)
+            return self._rng.choice(self._criticism_templates)
     
     def adjust_for_repetition(self, is_repeated_error):
         """
@@ -252,8 +263,6 @@ class ReinforcementStyler:
         Returns:
             dict: Adjustments to make to reinforcement
         """
-        traits = self.get_current_persona_traits()
-        
         if not is_repeated_error:
             return {"patience_modifier": 0.0, "detail_modifier": 0.0}
         
@@ -261,11 +270,9 @@ class ReinforcementStyler:
         patience_modifier = -0.2  # Decrease patience slightly
         detail_modifier = 0.2  # Increase detail slightly
         
-        if traits:
-            repetition_tolerance = traits.get("repetition_tolerance", 0.5)
-            
+        if self._has_traits:
             # Adjust based on repetition tolerance
-            patience_modifier = -0.3 + (repetition_tolerance * 0.2)  # Higher tolerance = less patience reduction
+            patience_modifier = -0.3 + (self._repetition_tolerance * 0.2)  # Higher tolerance = less patience reduction
             detail_modifier = 0.3  # Always increase detail for repetition
         
         return {"patience_modifier": patience_modifier, "detail_modifier": detail_modifier}
@@ -281,17 +288,11 @@ class ReinforcementStyler:
         Returns:
             dict: Reinforcement style parameters
         """
-        traits = self.get_current_persona_traits()
-        
-        # Determine if we should praise or criticize
-        should_praise = self.should_praise(score)
-        should_criticize = self.should_criticize(score)
-        
-        # Get template
-        if should_praise:
+        # Determine if we should praise or criticize (thresholds are cached per persona)
+        if score >= self._praise_threshold:
             template = self.generate_praise_template(score)
             tone = "positive"
-        elif should_criticize:
+        elif score < self._criticism_threshold:
             template = self.generate_criticism_template(score)
             tone = "negative"
         else:
@@ -304,9 +305,9 @@ class ReinforcementStyler:
         
         # Base style from persona traits
         base_style = {
-            "patience": traits.get("patience", 0.5) + repetition_adjustments["patience_modifier"],
+            "patience": self._patience + repetition_adjustments["patience_modifier"],
             "detail": 0.5 + repetition_adjustments["detail_modifier"],
-            "emotional_support": traits.get("emotional_support", 0.5),
+            "emotional_support": self._emotional_support,
             "tone": tone,
             "template": template
         }
@@ -68,6 +68,12 @@ def parse_args():
         help="Baby LLM model to use (overrides config)"
     )
     
+    parser.add_argument(
+        "--no-cache", 
+        action="store_true",
+        help="Always generate new dreams instead of reusing cached ones"
+    )
+    
     parser.add_argument(
         "--verbose", 
         action="store_true",
@@ -87,10 +93,8 @@ def setup_environment():
     
     # Ensure data directories exist
     data_dir = base_dir / "data"
-    os.makedirs(data_dir, exist_ok=True)
-    os.makedirs(data_dir / "logs", exist_ok=True)
-    os.makedirs(data_dir / "obsidian_vault", exist_ok=True)
-    os.makedirs(data_dir / "faiss_index", exist_ok=True)
+    for sub in ("logs", "obsidian_vault", "faiss_index"):
+        (data_dir / sub).mkdir(parents=True, exist_ok=True)
     
     # Configure logger
     logger.remove()
@@ -113,6 +117,8 @@ def run_cli_mode(config_path, args):
         simulation.config["models"]["baby"] = args.baby
     if args.obsidian:
         simulation.config["paths"]["obsidian_vault"] = args.obsidian
+    if args.no_cache:
+        simulation.dream_engine.cache = False
     
     # Start the simulation
     logger.info("Starting simulation in CLI mode")
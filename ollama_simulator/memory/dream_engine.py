@@ -9,21 +9,55 @@
 #  Last Update: June 22, 2025
 # ----------------------------------------------------------------------------
 
+import os
+import re
 import ollama
+import orjson
 import random
+import hashlib
+import collections
 from loguru import logger
+from pathlib import Path
 from datetime import datetime
+from .._exit_hooks import register_exit_hook
 from .hebbian_store import HebbianMemoryStore
 from .memory_retrieval import MemoryRetrieval
 from .memory_writer import MemoryWriter
 
+# Words too common to count as dream concepts
+_COMMON_WORDS = frozenset({'the', 'and', 'a', 'to', 'of', 'in', 'that', 'is', 'was', 'it', 'for', 'on', 'with'})
+
+# Candidate concept words for the fallback extraction (letters only, 4+ long)
+_CONCEPT_WORD_RE = re.compile(r"[A-Za-z]{4,}")
+
+# Separator the Mother emits between the dream and its key concepts
+_CONCEPTS_MARKER = "---CONCEPTS---"
+
+# Queries for dream-time memory selection, kept as constants so every call
+# reuses the same statement from sqlite3's statement cache
+_SQL_IMPORTANT_MEMORIES = '''
+SELECT id, content, created_at, last_accessed, access_count, emotional_tags, confidence, source
+FROM memories
+WHERE id IN (SELECT id FROM memories WHERE confidence > 0.7 ORDER BY RANDOM() LIMIT ?)
+   OR id IN (SELECT id FROM memories WHERE access_count > 1 ORDER BY access_count DESC LIMIT ?)
+   OR id IN (SELECT id FROM memories ORDER BY last_accessed DESC LIMIT ?)
+ORDER BY id
+'''
+
+_SQL_TOUCH_MEMORY = '''
+UPDATE memories
+SET access_count = access_count + 1, last_accessed = ?
+WHERE id = ?
+'''
+
 class DreamEngine:
     """
     Dream engine that simulates nighttime memory consolidation.
     Reinforces important memories, creates new associations, and prunes weak connections.
     """
     
-    def __init__(self, memory_store=None, mother_model="llama3.2:latest", baby_model="llama3.2:1b"):
+    def __init__(self, memory_store=None, mother_model="llama3.2:latest", baby_model="llama3.2:1b",
+                 cache=True, cache_path=None, cache_save_every=5, cache_size=256):
         """
         Initialize the dream engine.
         
@@ -31,12 +65,30 @@ class DreamEngine:
             memory_store: HebbianMemoryStore instance
             mother_model: Model name for the Mother LLM
             baby_model: Model name for the Baby LLM
+            cache: Whether to reuse dreams generated for the same baby state and
+                recent memories
+            cache_path: Path to the dream cache file
+            cache_save_every: Number of new dreams to cache before writing the file
+            cache_size: Maximum number of cached dreams; the least recently used
+                one is evicted when full
         """
         self.memory_store = memory_store or HebbianMemoryStore()
         self.memory_retrieval = MemoryRetrieval(memory_store, baby_model)
         self.memory_writer = MemoryWriter(memory_store, baby_model)
         self.mother_model = mother_model
         self.baby_model = baby_model
+        self._rng = random.Random()  # Per-engine generator for memory selection
+        self._dream_concepts = {}  # Dream content -> concepts emitted alongside it
+        
+        # Dream cache
+        self.cache = cache
+        self.cache_save_every = cache_save_every
+        self.cache_size = cache_size
+        self._dream_cache_path = Path(cache_path) if cache_path else Path(__file__).parent.parent / "data" / "cache" / "dreams.json"
+        self._dream_cache = self._load_dream_cache() if cache else collections.OrderedDict()
+        self._unsaved_dreams = 0
+        if cache:
+            register_exit_hook(self.flush_dream_cache)
         
         logger.info(f"Dream engine initialized with models: Mother={mother_model}, Baby={baby_model}")
     
@@ -74,9 +126,22 @@ class DreamEngine:
         4. Uses simple language and imagery
         5. Includes some repetition of important words or ideas
         
+        Write the dream content first. Then, after a line '{_CONCEPTS_MARKER}', list 3-5 key
+        concepts from the dream as hyphen bullets, one single word or short phrase per line.
+        
         Dream content:
         """
         
+        # Reuse the dream generated for an identical state and memory set
+        cache_key = None
+        if self.cache:
+            cache_key = self._dream_cache_key(baby_state, recent_memories)
+            cached = self._dream_cache.get(cache_key)
+            if cached is not None:
+                self._dream_cache.move_to_end(cache_key)
+                logger.info("Reusing cached dream content")
+                return self._finish_dream(cached)
+        
         # Generate dream content using Mother model
         try:
             if stream:
@@ -105,13 +170,117 @@ class DreamEngine:
                 )
                 dream_content = response['message']['content']
             
-            logger.info("Generated dream content")
-            return dream_content
-            
         except Exception as e:
             logger.error(f"Error generating dream content: {e}")
             # Fallback dream content
             return "I dreamed about learning new words and concepts. It was peaceful and reinforcing."
+        
+        logger.info("Generated dream content")
+        
+        if cache_key is not None:
+            self._store_dream(cache_key, dream_content)
+        
+        return self._finish_dream(dream_content)
+    
+    def _finish_dream(self, response_text):
+        """
+        Split a generated response and remember its concepts for process_dream.
+        
+        Args:
+            response_text: Mother's full response
+            
+        Returns:
+            str: Dream content without the concept list
+        """
+        dream_content, concepts = self._split_dream(response_text)
+        if concepts:
+            self._dream_concepts = {dream_content: concepts}
+        return dream_content
+    
+    @staticmethod
+    def _dream_cache_key(baby_state, recent_memories):
+        """
+        Build the cache key for a dream request.
+        
+        Args:
+            baby_state: Current state of the Baby LLM
+            recent_memories: Memories included in the dream prompt
+            
+        Returns:
+            str: Hex digest identifying the request
+        """
+        payload = orjson.dumps(
+            {
+                "vocabulary_size": baby_state.get('vocabulary_size', 0),
+                "concept_understanding": baby_state.get('concept_understanding', 'basic'),
+                "memory_ids": [m.get("id") for m in recent_memories]
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=str
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _load_dream_cache(self):
+        """
+        Load cached dreams from disk, keeping the cache_size most recently used.
+        
+        Returns:
+            collections.OrderedDict: Cache key to dream response, least recently used first
+        """
+        try:
+            entries = orjson.loads(self._dream_cache_path.read_bytes())
+        except FileNotFoundError:
+            return collections.OrderedDict()
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable dream cache {self._dream_cache_path}: {e}")
+            return collections.OrderedDict()
+        
+        if not isinstance(entries, dict):
+            logger.warning(f"Ignoring malformed dream cache {self._dream_cache_path}")
+            return collections.OrderedDict()
+        
+        # The file is written in recency order, so the newest entries are last
+        cache = collections.OrderedDict(list(entries.items())[-self.cache_size:])
+        logger.info(f"Loaded {len(cache)} cached dreams from {self._dream_cache_path}")
+        return cache
+    
+    def _store_dream(self, cache_key, response_text):
+        """
+        Add a generated dream to the cache, writing the file every cache_save_every dreams.
+        
+        Args:
+            cache_key: Key from _dream_cache_key
+            response_text: Mother's full response
+        """
+        self._dream_cache[cache_key] = response_text
+        if len(self._dream_cache) > self.cache_size:
+            self._dream_cache.popitem(last=False)
+        self._unsaved_dreams += 1
+        if self._unsaved_dreams >= self.cache_save_every:
+            self.flush_dream_cache()
+    
+    def flush_dream_cache(self):
+        """Write the dream cache to disk, replacing the previous file atomically."""
+        if not self._unsaved_dreams:
+            return
+        
+        tmp_path = f"{self._dream_cache_path}.tmp"
+        try:
+            os.makedirs(self._dream_cache_path.parent, exist_ok=True)
+            # orjson ignores OrderedDict's recency order, so copy into a plain dict
+            data = orjson.dumps(dict(self._dream_cache))
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._dream_cache_path)
+        except OSError as e:
+            # Keep the dreams in memory; the next flush tries again
+            logger.error(f"Error saving dream cache to {self._dream_cache_path}: {e}")
+            return
+        self._unsaved_dreams = 0
+        
+        logger.info(f"Dream cache saved to {self._dream_cache_path}")
     
     def process_dream(self, dream_content, baby_state):
         """
@@ -124,8 +293,10 @@ class DreamEngine:
         Returns:
             dict: Results of dream processing
         """
-        # Extract concepts from dream
-        reinforced_concepts = self._extract_concepts_from_dream(dream_content)
+        # Extract concepts from dream, reusing the ones generated with it when available
+        reinforced_concepts = self._extract_concepts_from_dream(
+            dream_content, self._dream_concepts.pop(dream_content, None)
+        )
         
         # Store the dream as a memory
         dream_memory_id = self.memory_writer.store_dream_memory(dream_content, reinforced_concepts)
@@ -158,16 +329,61 @@ class DreamEngine:
             "memory_stats": stats
         }
     
-    def _extract_concepts_from_dream(self, dream_content):
+    @staticmethod
+    def _parse_concepts(concept_text):
+        """
+        Parse a bulleted (or plain) list of concepts.
+        
+        Args:
+            concept_text: Text with one concept per line
+            
+        Returns:
+            list: Parsed concepts
+        """
+        concepts = []
+        for line in concept_text.split('\n'):
+            line = line.strip()
+            if line.startswith('-') or line.startswith('*'):
+                concept = line[1:].strip()
+                if concept:
+                    concepts.append(concept)
+            elif line and not any(c in line.lower() for c in ['concept', 'key', 'reinforced']):
+                # Might be a plain list without bullets
+                concepts.append(line)
+        
+        return concepts
+    
+    @classmethod
+    def _split_dream(cls, response_text):
+        """
+        Split a generated response into the dream and its concept list.
+        
+        Args:
+            response_text: Mother's response, optionally containing the concepts marker
+            
+        Returns:
+            tuple: (dream_content, concepts), with concepts None when the marker is missing
+        """
+        dream_content, marker, concept_text = response_text.partition(_CONCEPTS_MARKER)
+        if not marker:
+            return response_text, None
+        return dream_content.strip(), cls._parse_concepts(concept_text)
+    
+    def _extract_concepts_from_dream(self, dream_content, concepts=None):
         """
         Extract key concepts from dream content.
         
         Args:
             dream_content: Dream content
+            concepts: Concepts already emitted with the dream; when given, no
+                extraction request is made
             
         Returns:
             list: Extracted concepts
         """
+        if concepts:
+            return concepts
+        
         prompt = f"""
         Extract the key concepts from this dream sequence:
         
@@ -186,31 +402,16 @@ class DreamEngine:
                 ]
             )
             
-            concept_text = response['message']['content']
-            
             # Parse concepts from response
-            concepts = []
-            for line in concept_text.split('\n'):
-                line = line.strip()
-                if line.startswith('-') or line.startswith('*'):
-                    concept = line[1:].strip()
-                    if concept:
-                        concepts.append(concept)
-                elif line and not any(c in line.lower() for c in ['concept', 'key', 'reinforced']):
-                    # Might be a plain list without bullets
-                    concepts.append(line)
-            
-            return concepts
+            return self._parse_concepts(response['message']['content'])
             
         except Exception as e:
             logger.error(f"Error extracting concepts from dream: {e}")
             # Extract simple word-based concepts as fallback
-            words = dream_content.split()
-            # Filter to words of reasonable length, exclude common words
-            common_words = {'the', 'and', 'a', 'to', 'of', 'in', 'that', 'is', 'was', 'it', 'for', 'on', 'with'}
-            concepts = [w for w in words if len(w) > 3 and w.lower() not in common_words]
-            # Take unique concepts
-            return list(set(concepts))[:5]
+            words = _CONCEPT_WORD_RE.findall(dream_content)
+            # Exclude common words and take unique concepts in order of appearance
+            concepts = dict.fromkeys(w for w in words if w.lower() not in _COMMON_WORDS)
+            return list(concepts)[:5]
     
     def _get_important_memories(self, limit=5):
         """
@@ -222,49 +423,38 @@ class DreamEngine:
         Returns:
             list: Important memories
         """
-        # Get memories with high confidence
+        # Fetch memories with high confidence, high access count or recent access in one query
         cursor = self.memory_store.conn.cursor()
         
-        cursor.execute('''
-        SELECT id FROM memories
-        WHERE confidence > 0.7
-        ORDER BY RANDOM()
-        LIMIT ?
-        ''', (limit,))
-        
-        high_confidence_ids = [row[0] for row in cursor.fetchall()]
-        
-        # Get memories with high access count
-        cursor.execute('''
-        SELECT id FROM memories
-        WHERE access_count > 1
-        ORDER BY access_count DESC
-        LIMIT ?
-        ''', (limit,))
-        
-        high_access_ids = [row[0] for row in cursor.fetchall()]
-        
-        # Get recent memories
-        cursor.execute('''
-        SELECT id FROM memories
-        ORDER BY last_accessed DESC
-        LIMIT ?
-        ''', (limit,))
-        
-        recent_ids = [row[0] for row in cursor.fetchall()]
-        
-        # Combine and deduplicate
-        all_ids = list(set(high_confidence_ids + high_access_ids + recent_ids))
-        random.shuffle(all_ids)  # Randomize order
-        
-        # Get full memory data
-        memories = []
-        for memory_id in all_ids[:limit]:
-            memory = self.memory_store.get_memory_by_id(memory_id)
-            if memory:
-                memories.append(memory)
-        
-        return memories
+        cursor.execute(_SQL_IMPORTANT_MEMORIES, (limit, limit, limit))
+        
+        rows = cursor.fetchall()
+        self._rng.shuffle(rows)  # Randomize order
+        rows = rows[:limit]
+        
+        if not rows:
+            return []
+        
+        # Record the access, as get_memory_by_id would for each memory
+        now = datetime.now().isoformat()
+        cursor.executemany(_SQL_TOUCH_MEMORY, [(now, row[0]) for row in rows])
+        
+        self.memory_store.conn.commit()
+        
+        # Report the memories as they are after this access
+        return [
+            {
+                "id": row[0],
+                "content": row[1],
+                "created_at": row[2],
+                "last_accessed": now,
+                "access_count": row[4] + 1 if row[4] is not None else None,
+                "emotional_tags": orjson.loads(row[5]) if row[5] else {},
+                "confidence": row[6],
+                "source": row[7]
+            }
+            for row in rows
+        ]
     
     def _find_related_memories(self, content, limit=5):
         """
@@ -75,6 +75,14 @@ class HebbianMemoryStore:
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         conn = sqlite3.connect(str(self.db_path))
+        
+        # WAL with NORMAL sync avoids an fsync per commit; mmap and a larger
+        # page cache cut read syscalls on big memory tables
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA mmap_size=268435456')  # 256 MiB
+        conn.execute('PRAGMA cache_size=-64000')  # ~64 MB
+        
         cursor = conn.cursor()
         
         # Create tables if they don't exist
@@ -43,6 +43,7 @@ setup(
     install_requires=requirements,
     extras_require={
         "vector": ["faiss-cpu==1.7.4"],
+        "jit": ["numba>=0.59"],
     },
     entry_points={
         "console_scripts": [